@@ -4,24 +4,58 @@ GPU/CUDA Detection and Whisper Device Test
 Checks if your system can use GPU acceleration for transcription
 """
 
-import torch
-import whisper
+import argparse
+import functools
+import os
+
+# Defer loading CUDA kernels until they are first launched; must be set before torch is imported
+os.environ.setdefault("CUDA_MODULE_LOADING", "LAZY")
+
+
+@functools.lru_cache(maxsize=1)
+def detect_cuda():
+    """Query CUDA once and cache the result for the rest of the process"""
+    # Imported lazily so importing this module doesn't initialize the CUDA runtime
+    import torch
+
+    cuda_available = torch.cuda.is_available()
+    if not cuda_available:
+        return {'available': False}
+
+    properties = torch.cuda.get_device_properties(0)
+    return {
+        'available': True,
+        'cuda_version': torch.version.cuda,
+        'device_count': torch.cuda.device_count(),
+        'current_device': torch.cuda.current_device(),
+        'device_name': torch.cuda.get_device_name(0),
+        'total_memory': properties.total_memory,
+    }
+
+
+def check_gpu_status(full: bool = False):
+    """Check GPU availability and status
+
+    Args:
+        full: Also load the Whisper tiny model to verify the device binding end-to-end
+    """
+    import torch
 
-def check_gpu_status():
-    """Check GPU availability and status"""
     print("🔍 GPU/CUDA Detection Report")
     print("=" * 50)
     
     # Check PyTorch CUDA support
+    cuda_info = detect_cuda()
+    cuda_available = cuda_info['available']
     print(f"PyTorch version: {torch.__version__}")
-    print(f"CUDA available: {torch.cuda.is_available()}")
+    print(f"CUDA available: {cuda_available}")
     
-    if torch.cuda.is_available():
-        print(f"CUDA version: {torch.version.cuda}")
-        print(f"GPU device count: {torch.cuda.device_count()}")
-        print(f"Current device: {torch.cuda.current_device()}")
-        print(f"GPU name: {torch.cuda.get_device_name(0)}")
-        print(f"GPU memory: {torch.cuda.get_device_properties(0).total_memory / 1024**3:.1f} GB")
+    if cuda_available:
+        print(f"CUDA version: {cuda_info['cuda_version']}")
+        print(f"GPU device count: {cuda_info['device_count']}")
+        print(f"Current device: {cuda_info['current_device']}")
+        print(f"GPU name: {cuda_info['device_name']}")
+        print(f"GPU memory: {cuda_info['total_memory'] / 1024**3:.1f} GB")
     else:
         print("❌ No CUDA-capable GPU detected")
         print("💡 To enable GPU acceleration:")
@@ -34,21 +68,31 @@ def check_gpu_status():
     
     try:
         # Test Whisper device detection
-        device = "cuda" if torch.cuda.is_available() else "cpu"
+        device = "cuda" if cuda_available else "cpu"
         print(f"Whisper will use: {device.upper()}")
         
-        # Load a tiny model to test
-        print("Loading Whisper model...")
-        model = whisper.load_model("tiny", device=device)
+        # A one-element tensor round-trip exercises the same device init path as a model load
+        tensor = torch.zeros(1, device=device)
+        _ = tensor + 1
+        print(f"Tensor allocated on: {tensor.device}")
         
-        # Check actual device
-        if hasattr(model, 'encoder'):
-            model_device = next(model.encoder.parameters()).device
-            print(f"Model loaded on: {model_device}")
-        else:
-            print("Model loaded successfully")
+        if full:
+            import whisper
             
-        print("✅ Whisper GPU test completed")
+            # Load a tiny model to test
+            print("Loading Whisper model...")
+            model = whisper.load_model("tiny", device=device)
+            
+            # Check actual device
+            if hasattr(model, 'encoder'):
+                model_device = next(model.encoder.parameters()).device
+                print(f"Model loaded on: {model_device}")
+            else:
+                print("Model loaded successfully")
+            
+            print("✅ Whisper GPU test completed")
+        else:
+            print(f"✅ {device.upper()} tensor test passed (run with --full to load a Whisper model)")
         
     except Exception as e:
         print(f"❌ Whisper test failed: {e}")
@@ -56,7 +100,7 @@ def check_gpu_status():
     print("\n📊 Performance Recommendations")
     print("=" * 35)
     
-    if torch.cuda.is_available():
+    if cuda_available:
         print("🚀 GPU acceleration is available!")
         print("   - Transcription will be significantly faster")
         print("   - Recommended models: base, small, medium, large")
@@ -68,4 +112,7 @@ def check_gpu_status():
         print("   - Consider installing CUDA for better performance")
 
 if __name__ == "__main__":
-    check_gpu_status()
+    parser = argparse.ArgumentParser(description="GPU/CUDA detection and Whisper device test")
+    parser.add_argument("--full", action="store_true", help="Also load the Whisper tiny model as part of the device test")
+    args = parser.parse_args()
+    check_gpu_status(full=args.full)
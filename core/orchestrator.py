@@ -19,34 +19,53 @@ from system.database import db_manager
 from system.queue_processor import queue_processor
 from system.health_metrics import metrics_collector
 
-# Import processors
-from core.processors.video_processor import VideoProcessor
+# Import processors (VideoProcessor and ExcelProcessor are imported on demand,
+# they pull in Whisper/torch and xlsxwriter/openpyxl)
 from core.processors.upload_processor import UploadProcessor
 from core.processors.thumbnail_processor import ThumbnailProcessor
 from core.processors.aiwaverider_processor import AIWaveriderProcessor
 from core.processors.sheets_processor import SheetsProcessor
-from core.processors.excel_processor import ExcelProcessor
 
 
 class SocialMediaOrchestrator:
     """Main orchestrator that coordinates all processing components"""
     
-    def __init__(self):
-        """Initialize the orchestrator with all processors"""
-        self.video_processor = VideoProcessor()
+    MODES = ("full", "upload")
+    
+    def __init__(self, mode: str = "full"):
+        """Initialize the orchestrator with the processors needed for the mode
+        
+        Args:
+            mode: "full" downloads, transcribes and uploads; "upload" only uploads
+                  and reports on files that are already on disk
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown orchestrator mode: {mode}")
+        self.mode = mode
+        
+        self.video_processor = None
+        self.excel_processor = None
+        if mode == "full":
+            from core.processors.video_processor import VideoProcessor
+            from core.processors.excel_processor import ExcelProcessor
+            self.video_processor = VideoProcessor()
+            self.excel_processor = ExcelProcessor()
+        
         self.upload_processor = UploadProcessor()
         self.thumbnail_processor = ThumbnailProcessor()
         self.aiwaverider_processor = AIWaveriderProcessor()
         self.sheets_processor = SheetsProcessor()
-        self.excel_processor = ExcelProcessor()
         
         self.processing_pipeline = [
-            self.video_processor,
-            self.upload_processor,
-            self.thumbnail_processor,
-            self.aiwaverider_processor,
-            self.sheets_processor,
-            self.excel_processor
+            processor for processor in (
+                self.video_processor,
+                self.upload_processor,
+                self.thumbnail_processor,
+                self.aiwaverider_processor,
+                self.sheets_processor,
+                self.excel_processor
+            )
+            if processor is not None
         ]
     
     async def initialize(self):
@@ -86,9 +105,12 @@ class SocialMediaOrchestrator:
         try:
             logger.log_step(f"Starting pipeline processing for {len(urls)} URLs")
             
+            if self.video_processor is None:
+                logger.log_error(f"URL processing is not available in '{self.mode}' mode")
+                return False
+            
             # Ensure database is initialized
-            if not db_manager._initialized:
-                await db_manager.initialize()
+            await db_manager.ensure_initialized()
             
             # Step 1: Video Processing
             logger.log_step("Step 1: Video processing and transcription")
@@ -97,50 +119,76 @@ class SocialMediaOrchestrator:
                 logger.log_error("Video processing failed")
                 return False
             
-            # Step 2: Upload Processing (parallel with thumbnails)
-            logger.log_step("Step 2: Upload processing")
-            upload_tasks = [
-                self.upload_processor.process_videos(),
-                self.thumbnail_processor.process_thumbnails()
-            ]
-            
-            upload_results = await asyncio.gather(*upload_tasks, return_exceptions=True)
-            
-            # Check for upload errors
-            for i, result in enumerate(upload_results):
-                if isinstance(result, Exception):
-                    logger.log_error(f"Upload task {i} failed: {str(result)}")
-                elif not result:
-                    logger.log_error(f"Upload task {i} returned False")
-            
-            # Step 3: AIWaverider Upload
-            logger.log_step("Step 3: AIWaverider Drive upload")
-            aiwaverider_result = await self.aiwaverider_processor.upload_all()
-            if not aiwaverider_result:
-                logger.log_error("AIWaverider upload failed")
-                return False
+            return await self._run_upload_steps()
             
-            # Step 4: Sheets Update
-            logger.log_step("Step 4: Google Sheets update")
-            sheets_result = await self.sheets_processor.update_master_sheet()
-            if not sheets_result:
-                logger.log_error("Sheets update failed")
-                return False
+        except Exception as e:
+            logger.log_error(f"Error in pipeline processing: {str(e)}")
+            return False
+    
+    async def process_uploads(self) -> bool:
+        """Upload and report on files already on disk, without downloading anything"""
+        try:
+            logger.log_step("Starting upload pipeline")
             
-            # Step 5: Excel Generation and Upload
-            logger.log_step("Step 5: Excel file generation and upload")
-            excel_result = await self.excel_processor.generate_and_upload_excel()
-            if not excel_result:
-                logger.log_error("Excel generation and upload failed")
-                return False
+            # Ensure database is initialized
+            await db_manager.ensure_initialized()
             
-            logger.log_step("Pipeline processing completed successfully")
-            return True
+            return await self._run_upload_steps()
             
         except Exception as e:
-            logger.log_error(f"Error in pipeline processing: {str(e)}")
+            logger.log_error(f"Error in upload pipeline: {str(e)}")
             return False
     
+    async def _run_upload_steps(self) -> bool:
+        """Run the upload and reporting steps (2-5) of the pipeline"""
+        # Step 2: Upload Processing (parallel with thumbnails)
+        logger.log_step("Step 2: Upload processing")
+        upload_tasks = [
+            self.upload_processor.process_videos(),
+            self.thumbnail_processor.process_thumbnails()
+        ]
+        
+        upload_results = await asyncio.gather(*upload_tasks, return_exceptions=True)
+        
+        # Check for upload errors
+        for i, result in enumerate(upload_results):
+            if isinstance(result, Exception):
+                logger.log_error(f"Upload task {i} failed: {str(result)}")
+            elif not result:
+                logger.log_error(f"Upload task {i} returned False")
+        
+        # Step 3: AIWaverider Upload
+        logger.log_step("Step 3: AIWaverider Drive upload")
+        aiwaverider_result = await self.aiwaverider_processor.upload_all()
+        if not aiwaverider_result:
+            logger.log_error("AIWaverider upload failed")
+            return False
+        
+        # Step 4 & 5: Sheets update and Excel generation both only read the
+        # database state produced above, so they run concurrently
+        logger.log_step("Step 4: Google Sheets update")
+        report_steps = [("Sheets update", self.sheets_processor.update_master_sheet())]
+        if self.excel_processor is not None:
+            logger.log_step("Step 5: Excel file generation and upload")
+            report_steps.append(("Excel generation and upload", self.excel_processor.generate_and_upload_excel()))
+        
+        report_results = await asyncio.gather(*[step for _, step in report_steps], return_exceptions=True)
+        
+        report_failed = False
+        for (name, _), result in zip(report_steps, report_results):
+            if isinstance(result, Exception):
+                logger.log_error(f"{name} failed: {str(result)}")
+                report_failed = True
+            elif not result:
+                logger.log_error(f"{name} failed")
+                report_failed = True
+        
+        if report_failed:
+            return False
+        
+        logger.log_step("Pipeline processing completed successfully")
+        return True
+    
     async def cleanup(self):
         """Cleanup all resources"""
         try:
@@ -155,14 +203,15 @@ class SocialMediaOrchestrator:
                 await processor.cleanup()
                 logger.log_step(f"Cleaned up {processor.__class__.__name__}")
             
+            # Finish metrics while the database is still open
+            metrics_collector.finish_processing_metrics()
+            await metrics_collector.flush_metrics()
+            logger.log_step("Metrics collection finished")
+            
             # Close database
             await db_manager.close()
             logger.log_step("Database connections closed")
             
-            # Finish metrics
-            metrics_collector.finish_processing_metrics()
-            logger.log_step("Metrics collection finished")
-            
             logger.log_step("Cleanup completed successfully")
             
         except Exception as e:
@@ -187,9 +236,9 @@ class SocialMediaOrchestrator:
             return {'error': str(e)}
 
 
-async def main():
+async def main(mode: str = "full"):
     """Main entry point"""
-    orchestrator = SocialMediaOrchestrator()
+    orchestrator = SocialMediaOrchestrator(mode=mode)
     
     try:
         # Initialize
@@ -197,6 +246,14 @@ async def main():
             logger.log_error("Failed to initialize orchestrator")
             return
         
+        if mode == "upload":
+            success = await orchestrator.process_uploads()
+            if success:
+                logger.log_step("Upload processing completed successfully")
+            else:
+                logger.log_error("Upload processing failed")
+            return
+        
         # Load URLs
         urls_file = 'data/urls.txt'
         if not os.path.exists(urls_file):
@@ -231,4 +288,11 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Social Media Content Orchestrator')
+    parser.add_argument('--upload-only', action='store_true',
+                        help='Only upload and report on files already on disk (skips download/transcription and Excel)')
+    args = parser.parse_args()
+    
+    asyncio.run(main(mode="upload" if args.upload_only else "full"))
@@ -6,15 +6,16 @@ Integrates real logic from social_media_processor.py
 """
 
 import asyncio
+import hashlib
 import os
 import sys
 import json
+import mmap
 import time
 import uuid
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Set
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -24,10 +25,17 @@ from system.database import db_manager
 from system.config import settings
 from system.error_recovery import retry_async, RetryConfig, AIWAVERIDER_RETRY_CONFIG, CircuitBreaker
 
-# HTTP requests
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+# HTTP client
+import aiohttp
+
+# Faster JSON for the file list cache when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Responses worth retrying when listing files
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
 
 
 class AIWaveriderProcessor(BaseProcessor):
@@ -50,10 +58,32 @@ class AIWaveriderProcessor(BaseProcessor):
         # HTTP session for connection pooling
         self._session = None
         
+        # Files at least this large go through the chunked upload endpoint
+        self.chunked_upload_threshold = 10 * 1024 * 1024
+        
+        # Chunked uploads hold many connections and a lot of bandwidth each,
+        # so only a few of them may run at once. upload_all takes this before
+        # an upload slot, so queued large files never sit on a slot
+        self._large_file_semaphore = asyncio.Semaphore(settings.aiwaverider_max_large_uploads)
+        
+        # Chunks of one upload are independent, so several are sent at once
+        self.chunk_concurrency = 8
+        
+        # Completed uploads recorded per database write
+        self.status_batch_size = 50
+        
+        # Files at least this large are dropped from the page cache once uploaded
+        self.drop_cache_threshold = 100 * 1024 * 1024
+        
         # Cache directory
         self.cache_dir = "data/cache"
         os.makedirs(self.cache_dir, exist_ok=True)
         
+        # In-process copy of the remote file lists: folder_path -> (timestamp, filenames)
+        self._existing_files_cache: Dict[str, tuple] = {}
+        self._existing_files_locks: Dict[str, asyncio.Lock] = {}
+        self._cache_paths: Dict[str, str] = {}
+        
         # Circuit breaker for AIWaverider API
         self.circuit_breaker = CircuitBreaker(
             failure_threshold=5,
@@ -71,8 +101,9 @@ class AIWaveriderProcessor(BaseProcessor):
                 self.log_error("AIWaverider token not found in configuration")
                 return False
             
-            # Initialize HTTP session with connection pooling
-            self._session = self._get_http_session()
+            # Initialize HTTP session with connection pooling (the only place it is created)
+            if self._session is None or self._session.closed:
+                self._session = self._create_http_session()
             
             self.initialized = True
             self.status = "ready"
@@ -83,25 +114,23 @@ class AIWaveriderProcessor(BaseProcessor):
             self.log_error("Failed to initialize AIWaverider processor", e)
             return False
     
-    def _get_http_session(self):
-        """Get HTTP session with connection pooling and retry strategy"""
-        if self._session is None:
-            session = requests.Session()
-            
-            # Configure retry strategy
-            retry_strategy = Retry(
-                total=3,
-                backoff_factor=1,
-                status_forcelist=[429, 500, 502, 503, 504],
-            )
-            
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            session.mount("http://", adapter)
-            session.mount("https://", adapter)
-            
-            self._session = session
-        
-        return self._session
+    def _create_http_session(self) -> aiohttp.ClientSession:
+        """Create async HTTP session with connection pooling"""
+        # Enough connections for every upload slot, the extra chunks of the
+        # chunked uploads, and the two folder listings, so requests never
+        # queue on the pool behind the semaphores
+        max_connections = (
+            settings.aiwaverider_max_concurrent_uploads
+            + settings.aiwaverider_max_large_uploads * (self.chunk_concurrency - 1)
+            + 2
+        )
+        connector = aiohttp.TCPConnector(limit=max_connections, limit_per_host=max_connections, keepalive_timeout=75)
+        # Every AIWaverider endpoint takes the same bearer token
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={'Authorization': f'Bearer {self.token}'},
+            timeout=aiohttp.ClientTimeout(total=300)
+        )
     
     async def process(self, urls: List[str] = None) -> bool:
         """Main processing method - alias for upload_all"""
@@ -111,6 +140,11 @@ class AIWaveriderProcessor(BaseProcessor):
         """Upload all completed videos and thumbnails to AIWaverider Drive"""
         try:
             self.log_step("Starting AIWaverider Drive uploads")
+            
+            if self._session is None or self._session.closed:
+                self.log_error("AIWaverider processor is not initialized")
+                return False
+            
             self.status = "processing"
             
             # Get videos and thumbnails from database
@@ -121,70 +155,122 @@ class AIWaveriderProcessor(BaseProcessor):
                 self.log_step("No completed videos or thumbnails found in database")
                 return True
             
-            # Get existing files from AIWaverider Drive to avoid duplicates
-            existing_videos = await self._get_existing_files(self.video_folder_path)
-            existing_thumbnails = await self._get_existing_files(self.thumbnail_folder_path)
+            # Skip anything the database already records as mirrored to AIWaverider
+            videos = [video for video in videos if video.get('aiwaverider_status') != 'COMPLETED']
+            thumbnails = [thumbnail for thumbnail in thumbnails if thumbnail.get('aiwaverider_status') != 'COMPLETED']
+            
+            if not videos and not thumbnails:
+                self.log_step("All completed videos and thumbnails are already on AIWaverider Drive")
+                return True
+            
+            # Get existing files from AIWaverider Drive to avoid duplicates (only for folders with
+            # pending files); the two folder listings are independent, so fetch them together
+            existing_videos, existing_thumbnails = await asyncio.gather(
+                self._get_existing_files_if(bool(videos), self.video_folder_path),
+                self._get_existing_files_if(bool(thumbnails), self.thumbnail_folder_path)
+            )
             
             self.log_step(f"Found {len(existing_videos)} existing videos and {len(existing_thumbnails)} existing thumbnails on AIWaverider Drive")
             
-            # Prepare upload tasks
+            # Prepare upload tasks; status updates are collected and written in batches
             upload_tasks = []
+            completed_ids = {'video': [], 'thumbnail': []}
             
             # Add video upload tasks
             for video in videos:
                 filename = video.get('filename', '')
                 file_path = video.get('file_path', '')
                 
-                if filename not in existing_videos and file_path and os.path.exists(file_path):
-                    upload_tasks.append(('video', file_path, video))
+                if filename in existing_videos:
+                    # Record it so the next run doesn't need the remote listing for this file
+                    completed_ids['video'].append(video['id'])
+                elif file_path:
+                    file_size = self._get_file_size(file_path)
+                    if file_size is not None:
+                        upload_tasks.append(('video', file_path, os.path.basename(file_path), video, file_size))
             
             # Add thumbnail upload tasks
             for thumbnail in thumbnails:
                 filename = thumbnail.get('filename', '')
                 file_path = thumbnail.get('file_path', '')
                 
-                if filename not in existing_thumbnails and file_path and os.path.exists(file_path):
-                    upload_tasks.append(('thumbnail', file_path, thumbnail))
+                if filename in existing_thumbnails:
+                    completed_ids['thumbnail'].append(thumbnail['id'])
+                elif file_path:
+                    file_size = self._get_file_size(file_path)
+                    if file_size is not None:
+                        upload_tasks.append(('thumbnail', file_path, os.path.basename(file_path), thumbnail, file_size))
             
             if not upload_tasks:
+                await self._flush_completed_status(completed_ids)
                 self.log_step("No new files to upload to AIWaverider Drive")
                 return True
             
-            self.log_step(f"Starting parallel upload of {len(upload_tasks)} files...")
+            # Chunked uploads start largest first so a big video doesn't begin last
+            # and run alone at the end; small files keep their order and fill the
+            # upload slots the chunked uploads leave free
+            large_tasks = sorted(
+                (task for task in upload_tasks if task[4] >= self.chunked_upload_threshold),
+                key=lambda task: task[4], reverse=True
+            )
+            upload_tasks = large_tasks + [task for task in upload_tasks if task[4] < self.chunked_upload_threshold]
             
-            # Create semaphore to limit concurrent uploads (max 3 at a time)
-            semaphore = asyncio.Semaphore(3)
+            self.log_step(f"Starting parallel upload of {len(upload_tasks)} files...")
             
-            async def upload_with_semaphore(file_type: str, file_path: str, file_data: Dict):
-                async with semaphore:
-                    self.log_step(f"Uploading {file_type}: {os.path.basename(file_path)}")
-                    if file_type == 'video':
-                        return await self._upload_video_to_aiwaverider(file_path)
-                    else:
-                        return await self._upload_thumbnail_to_aiwaverider(file_path)
+            # Create semaphore to limit concurrent uploads
+            semaphore = asyncio.Semaphore(settings.aiwaverider_max_concurrent_uploads)
             
-            # Execute uploads in parallel
-            results = await asyncio.gather(
-                *[upload_with_semaphore(file_type, file_path, file_data) 
-                  for file_type, file_path, file_data in upload_tasks],
-                return_exceptions=True
-            )
+            async def upload_with_semaphore(file_type: str, file_path: str, filename: str, file_data: Dict, file_size: int):
+                # Large files wait for a chunked upload slot before taking an upload slot
+                if file_size >= self.chunked_upload_threshold:
+                    async with self._large_file_semaphore:
+                        return await upload_in_slot(file_type, file_path, filename, file_data, file_size)
+                return await upload_in_slot(file_type, file_path, filename, file_data, file_size)
             
-            # Process results
-            for i, result in enumerate(results):
-                file_type, file_path, file_data = upload_tasks[i]
-                if isinstance(result, Exception):
-                    self.log_error(f"Upload task {i} failed: {str(result)}")
-                    self.failed_count += 1
-                elif result:
-                    self.uploaded_count += 1
-                    # Update database status
-                    if file_type == 'video':
-                        await db_manager.update_video_aiwaverider_status(file_data['id'], 'COMPLETED')
+            async def upload_in_slot(file_type: str, file_path: str, filename: str, file_data: Dict, file_size: int):
+                async with semaphore:
+                    self.log_step(f"Uploading {file_type}: {filename}")
+                    try:
+                        if file_type == 'video':
+                            result = await self._upload_video_to_aiwaverider(file_path, check_existing=False, file_size=file_size, filename=filename)
+                        else:
+                            result = await self._upload_thumbnail_to_aiwaverider(file_path, check_existing=False, file_size=file_size, filename=filename)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        self.log_error(f"Upload of {filename} failed: {str(e)}")
+                        result = False
+                    return file_type, file_data, result
+            
+            # Files were filtered against the remote listing above, so the
+            # per-file existence check is skipped
+            # Execute uploads in parallel, recording each result as soon as it finishes
+            tasks = [
+                asyncio.create_task(upload_with_semaphore(file_type, file_path, filename, file_data, file_size))
+                for file_type, file_path, filename, file_data, file_size in upload_tasks
+            ]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    file_type, file_data, result = await next_done
+                    if result:
+                        self.uploaded_count += 1
+                        # Update database status
+                        completed_ids[file_type].append(file_data['id'])
+                        if len(completed_ids['video']) + len(completed_ids['thumbnail']) >= self.status_batch_size:
+                            await self._flush_completed_status(completed_ids)
                     else:
-                        await db_manager.update_thumbnail_aiwaverider_status(file_data['id'], 'COMPLETED')
-                else:
-                    self.failed_count += 1
+                        self.failed_count += 1
+            finally:
+                # Don't leave uploads running if we were cancelled or a status update
+                # failed; wait for them to stop so none outlive the HTTP session
+                try:
+                    await self._cancel_and_wait(tasks)
+                finally:
+                    # Record whatever finished, even when the loop was interrupted
+                    try:
+                        await self._flush_completed_status(completed_ids)
+                    except Exception as e:
+                        self.log_error("Error saving AIWaverider upload status", e)
             
             self.status = "completed"
             self.log_step(f"AIWaverider upload completed: {self.uploaded_count} successful, {self.failed_count} failed")
@@ -195,44 +281,114 @@ class AIWaveriderProcessor(BaseProcessor):
             self.status = "error"
             return False
     
+    async def _flush_completed_status(self, completed_ids: Dict[str, List[int]]) -> None:
+        """Mark the collected videos and thumbnails as uploaded and clear the batch once recorded"""
+        video_ids, thumbnail_ids = completed_ids['video'][:], completed_ids['thumbnail'][:]
+        completed_ids['video'].clear()
+        completed_ids['thumbnail'].clear()
+        try:
+            await db_manager.bulk_update_video_aiwaverider_status(video_ids, 'COMPLETED')
+            await db_manager.bulk_update_thumbnail_aiwaverider_status(thumbnail_ids, 'COMPLETED')
+        except Exception:
+            # Put the ids back so a later flush still records these uploads
+            completed_ids['video'][:0] = video_ids
+            completed_ids['thumbnail'][:0] = thumbnail_ids
+            raise
+    
     async def _get_existing_files(self, folder_path: str) -> Set[str]:
         """Get list of existing files in AIWaverider Drive folder"""
         try:
-            # Check cache first
-            cache_file = os.path.join(self.cache_dir, f"cache_{folder_path.replace('/', '_').replace('\\', '_')}.json")
-            
-            if os.path.exists(cache_file):
-                with open(cache_file, 'r') as f:
-                    cache_data = json.load(f)
-                    cache_age = time.time() - cache_data.get('timestamp', 0)
+            # Check the in-process cache first
+            cached = self._get_cached_existing_files(folder_path)
+            if cached is not None:
+                return cached
+            
+            # One lookup per folder at a time, concurrent callers wait for its result
+            lock = self._existing_files_locks.setdefault(folder_path, asyncio.Lock())
+            async with lock:
+                cached = self._get_cached_existing_files(folder_path)
+                if cached is not None:
+                    return cached
+                
+                # Check cache file next
+                cache_file = self._get_cache_path(folder_path)
+                
+                cache_data = self._read_cache_file(cache_file)
+                if cache_data:
+                    cache_timestamp = cache_data.get('timestamp', 0)
+                    cache_age = time.time() - cache_timestamp
                     if cache_age < self.cache_duration_hours * 3600:
                         self.log_step(f"Using cached file list for {folder_path} (age: {cache_age/60:.1f} minutes)")
-                        return set(cache_data.get('files', []))
-            
-            # Get fresh data
-            files = await self._get_fresh_file_list(folder_path)
-            
-            # Cache the result
-            try:
-                with open(cache_file, 'w') as f:
-                    json.dump({'files': list(files), 'timestamp': time.time()}, f)
-                self.log_step(f"Cached file list for {folder_path}")
-            except Exception as e:
-                self.log_step(f"Cache write error: {str(e)}")
-            
-            return files
+                        files = set(cache_data.get('files', []))
+                        self._existing_files_cache[folder_path] = (cache_timestamp, files)
+                        return files
+                
+                # Get fresh data
+                files = await self._get_fresh_file_list(folder_path)
+                timestamp = time.time()
+                self._existing_files_cache[folder_path] = (timestamp, files)
+                
+                # Cache the result
+                try:
+                    self._write_cache_file(cache_file, {'files': sorted(files), 'timestamp': timestamp})
+                    self.log_step(f"Cached file list for {folder_path}")
+                except Exception as e:
+                    self.log_step(f"Cache write error: {str(e)}")
+                
+                return files
             
         except Exception as e:
             self.log_error(f"Error getting existing files for {folder_path}: {str(e)}")
             return set()
     
+    def _get_cache_path(self, folder_path: str) -> str:
+        """Get the cache file for a folder, named by a hash of its path"""
+        cache_file = self._cache_paths.get(folder_path)
+        if cache_file is None:
+            key = hashlib.blake2b(folder_path.encode('utf-8'), digest_size=16).hexdigest()
+            cache_file = os.path.join(self.cache_dir, f"flist_{key}.json")
+            self._cache_paths[folder_path] = cache_file
+        return cache_file
+    
+    @staticmethod
+    def _read_cache_file(cache_file: str) -> Dict[str, Any]:
+        """Read a file list cache, treating an unreadable cache as missing"""
+        try:
+            with open(cache_file, 'rb') as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson else json.loads(raw)
+        except (OSError, ValueError):
+            return {}
+    
+    @staticmethod
+    def _write_cache_file(cache_file: str, cache_data: Dict[str, Any]) -> None:
+        """Write a file list cache atomically so a crash never leaves a partial file"""
+        raw = orjson.dumps(cache_data) if orjson else json.dumps(cache_data).encode('utf-8')
+        tmp_file = f"{cache_file}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(raw)
+        os.replace(tmp_file, cache_file)
+    
+    async def _get_existing_files_if(self, needed: bool, folder_path: str) -> Set[str]:
+        """Get existing files for a folder, or an empty set when the folder has nothing pending"""
+        if not needed:
+            return set()
+        return await self._get_existing_files(folder_path)
+    
+    def _get_cached_existing_files(self, folder_path: str) -> Optional[Set[str]]:
+        """Get the in-process file list for a folder if it is still fresh"""
+        cached = self._existing_files_cache.get(folder_path)
+        if cached is None:
+            return None
+        
+        timestamp, files = cached
+        if time.time() - timestamp >= self.cache_duration_hours * 3600:
+            return None
+        return files
+    
     async def _get_fresh_file_list(self, folder_path: str) -> Set[str]:
         """Get fresh list of files from AIWaverider Drive"""
         try:
-            headers = {
-                'Authorization': f'Bearer {self.token}'
-            }
-            
             list_url = self.upload_url.replace('/webhook/files/upload', '/api/files/list')
             params = {
                 'folder_path': folder_path
@@ -240,22 +396,28 @@ class AIWaveriderProcessor(BaseProcessor):
             
             self.log_step(f"Getting fresh file list from AIWaverider Drive for folder: {folder_path}")
             
-            response = self._session.get(
-                list_url,
-                headers=headers,
-                params=params,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                files = data.get('files', [])
-                filenames = {file_info.get('name') for file_info in files if file_info.get('name')}
-                self.log_step(f"Found {len(filenames)} files in AIWaverider Drive folder: {folder_path}")
-                return filenames
-            else:
-                self.log_error(f"Failed to get file list. Status: {response.status_code}, Response: {response.text}")
-                return set()
+            session = self._session
+            max_retries = 3
+            for attempt in range(max_retries + 1):
+                async with session.get(
+                    list_url,
+                    params=params,
+                    timeout=aiohttp.ClientTimeout(total=30)
+                ) as response:
+                    if response.status == 200:
+                        data = await response.json(loads=orjson.loads if orjson else json.loads, content_type=None)
+                        files = data.get('files', [])
+                        filenames = {file_info.get('name') for file_info in files if file_info.get('name')}
+                        self.log_step(f"Found {len(filenames)} files in AIWaverider Drive folder: {folder_path}")
+                        return filenames
+                    
+                    response_text = await response.text()
+                    if response.status in RETRYABLE_STATUSES and attempt < max_retries:
+                        await asyncio.sleep(2 ** attempt)
+                        continue
+                    
+                    self.log_error(f"Failed to get file list. Status: {response.status}, Response: {response_text}")
+                    return set()
                 
         except Exception as e:
             self.log_error(f"Error getting fresh file list from AIWaverider Drive: {str(e)}")
@@ -284,126 +446,126 @@ class AIWaveriderProcessor(BaseProcessor):
             self.log_error(f"Error checking file existence on AIWaverider Drive: {str(e)}")
             return False
     
-    async def _upload_video_to_aiwaverider(self, video_path: str) -> bool:
-        """Upload video to AIWaverider Drive with existence checking"""
-        filename = os.path.basename(video_path)
+    async def _upload_video_to_aiwaverider(self, video_path: str, check_existing: bool = True,
+                                           file_size: Optional[int] = None, filename: Optional[str] = None) -> bool:
+        """Upload video to AIWaverider Drive, optionally skipping the existence check when the caller already did it"""
+        filename = filename or os.path.basename(video_path)
         
         # Check if file already exists on AIWaverider Drive
-        if await self._check_file_exists_on_aiwaverider(filename, self.video_folder_path):
+        if check_existing and await self._check_file_exists_on_aiwaverider(filename, self.video_folder_path):
             self.log_step(f"Video {filename} already exists on AIWaverider Drive. Skipping.")
             return True
         
-        return await self._upload_to_aiwaverider_drive_async(video_path, self.video_folder_path, "video")
+        return await self._upload_to_aiwaverider_drive_async(video_path, self.video_folder_path, "video", file_size, filename)
     
-    async def _upload_thumbnail_to_aiwaverider(self, thumbnail_path: str) -> bool:
-        """Upload thumbnail to AIWaverider Drive with existence checking"""
-        filename = os.path.basename(thumbnail_path)
+    async def _upload_thumbnail_to_aiwaverider(self, thumbnail_path: str, check_existing: bool = True,
+                                               file_size: Optional[int] = None, filename: Optional[str] = None) -> bool:
+        """Upload thumbnail to AIWaverider Drive, optionally skipping the existence check when the caller already did it"""
+        filename = filename or os.path.basename(thumbnail_path)
         
         # Check if file already exists on AIWaverider Drive
-        if await self._check_file_exists_on_aiwaverider(filename, self.thumbnail_folder_path):
+        if check_existing and await self._check_file_exists_on_aiwaverider(filename, self.thumbnail_folder_path):
             self.log_step(f"Thumbnail {filename} already exists on AIWaverider Drive. Skipping.")
             return True
         
-        return await self._upload_to_aiwaverider_drive_async(thumbnail_path, self.thumbnail_folder_path, "thumbnail")
+        return await self._upload_to_aiwaverider_drive_async(thumbnail_path, self.thumbnail_folder_path, "thumbnail", file_size, filename)
     
     @retry_async(AIWAVERIDER_RETRY_CONFIG)
-    async def _upload_to_aiwaverider_drive_async(self, file_path: str, folder_path: str, file_type: str) -> bool:
+    async def _upload_to_aiwaverider_drive_async(self, file_path: str, folder_path: str, file_type: str,
+                                                 file_size: Optional[int] = None, filename: Optional[str] = None) -> bool:
         """Async upload file to AIWaverider Drive with support for chunked uploads, retry logic, and circuit breaker"""
         try:
-            # Use circuit breaker to protect against API failures
-            return await self.circuit_breaker.call_async(self._perform_upload, file_path, folder_path, file_type)
+            # Use circuit breaker to protect against API failures, calling the upload directly
+            self.circuit_breaker.before_call("_perform_upload")
+            try:
+                result = await self._perform_upload(file_path, folder_path, file_type, file_size, filename)
+            except Exception:
+                self.circuit_breaker.record_failure()
+                raise
+            self.circuit_breaker.record_success()
+            return result
                 
         except Exception as e:
             self.log_error(f"Error uploading {file_type} to AIWaverider Drive: {str(e)}")
             return False
     
-    async def _perform_upload(self, file_path: str, folder_path: str, file_type: str) -> bool:
+    async def _perform_upload(self, file_path: str, folder_path: str, file_type: str,
+                              file_size: Optional[int] = None, filename: Optional[str] = None) -> bool:
         """Perform the actual upload operation (called by circuit breaker)"""
         try:
             if not self.token:
                 self.log_error("AIWaverider token not found")
                 return False
                 
-            if not os.path.exists(file_path):
+            # Check file size to determine upload method (callers that already stat'ed the file pass it in)
+            if file_size is None:
+                file_size = self._get_file_size(file_path)
+            if file_size is None:
                 self.log_error(f"File not found: {file_path}")
                 return False
             
-            # Check file size to determine upload method
-            file_size = os.path.getsize(file_path)
             file_size_mb = file_size / (1024 * 1024)
+            filename = filename or os.path.basename(file_path)
             
             self.log_step(f"File size: {file_size_mb:.2f} MB")
             
-            if file_size_mb < 10:
+            if file_size < self.chunked_upload_threshold:
                 # Use regular upload for files under 10MB
-                return await self._upload_small_file_async(file_path, folder_path, file_type)
+                return await self._upload_small_file(file_path, folder_path, file_type, filename)
             else:
                 # Use chunked upload for files 10MB and above
-                return await self._upload_large_file_chunked_async(file_path, folder_path, file_type)
+                return await self._upload_large_file_chunked(file_path, folder_path, file_type, file_size, filename)
                 
         except Exception as e:
             self.log_error(f"Error in upload operation: {str(e)}")
             raise
     
-    async def _upload_small_file_async(self, file_path: str, folder_path: str, file_type: str) -> bool:
-        """Async upload small files (< 10MB) using regular upload endpoint"""
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            return await loop.run_in_executor(executor, self._upload_small_file, file_path, folder_path, file_type)
+    @staticmethod
+    def _get_file_size(file_path: str) -> Optional[int]:
+        """Get a file's size with a single stat call, or None if it doesn't exist"""
+        try:
+            return os.stat(file_path).st_size
+        except OSError:
+            return None
     
-    def _upload_small_file(self, file_path: str, folder_path: str, file_type: str) -> bool:
+    async def _upload_small_file(self, file_path: str, folder_path: str, file_type: str, filename: str) -> bool:
         """Upload small files (< 10MB) using regular upload endpoint"""
         try:
-            headers = {
-                'Authorization': f'Bearer {self.token}'
-            }
-            
             with open(file_path, 'rb') as file:
-                files = {
-                    'file': (os.path.basename(file_path), file, 'application/octet-stream')
-                }
-                data = {
-                    'folder_path': folder_path
-                }
+                # aiohttp streams the file object, so the body is never held in memory
+                data = aiohttp.FormData()
+                data.add_field('folder_path', folder_path)
+                data.add_field('file', file, filename=filename, content_type='application/octet-stream')
                 
-                self.log_step(f"Uploading small {file_type} to AIWaverider Drive: {os.path.basename(file_path)}")
+                self.log_step(f"Uploading small {file_type} to AIWaverider Drive: {filename}")
                 self.log_step(f"Folder path: {folder_path}")
                 
-                response = self._session.post(
+                async with self._session.post(
                     self.upload_url,
-                    headers=headers,
-                    files=files,
                     data=data,
-                    timeout=300
-                )
+                    timeout=aiohttp.ClientTimeout(total=300)
+                ) as response:
+                    response_text = await response.text()
                 
-                if response.status_code == 200:
-                    self.log_step(f"Successfully uploaded small {file_type} to AIWaverider Drive: {os.path.basename(file_path)}")
+                if response.status == 200:
+                    self.log_step(f"Successfully uploaded small {file_type} to AIWaverider Drive: {filename}")
                     return True
                 else:
-                    self.log_error(f"Failed to upload small {file_type} to AIWaverider Drive. Status: {response.status_code}, Response: {response.text}")
+                    self.log_error(f"Failed to upload small {file_type} to AIWaverider Drive. Status: {response.status}, Response: {response_text}")
                     return False
                     
         except Exception as e:
             self.log_error(f"Error uploading small {file_type} to AIWaverider Drive: {str(e)}")
             return False
     
-    async def _upload_large_file_chunked_async(self, file_path: str, folder_path: str, file_type: str) -> bool:
-        """Async upload large files (>= 10MB) using chunked upload endpoint"""
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            return await loop.run_in_executor(executor, self._upload_large_file_chunked, file_path, folder_path, file_type)
-    
-    def _upload_large_file_chunked(self, file_path: str, folder_path: str, file_type: str) -> bool:
+    async def _upload_large_file_chunked(self, file_path: str, folder_path: str, file_type: str, file_size: int, filename: str) -> bool:
         """Upload large files (>= 10MB) using chunked upload endpoint"""
         try:
             # Generate unique upload ID
             upload_id = str(uuid.uuid4())
-            filename = os.path.basename(file_path)
             
             # Calculate chunk size (5MB chunks)
             chunk_size = 5 * 1024 * 1024  # 5MB
-            file_size = os.path.getsize(file_path)
             total_chunks = (file_size + chunk_size - 1) // chunk_size  # Ceiling division
             
             self.log_step(f"Starting chunked upload for large {file_type}: {filename}")
@@ -412,12 +574,12 @@ class AIWaveriderProcessor(BaseProcessor):
             self.log_step(f"Upload ID: {upload_id}")
             
             # Step 1: Upload file chunks
-            if not self._upload_file_chunks(file_path, upload_id, chunk_size, total_chunks):
+            if not await self._upload_file_chunks(file_path, upload_id, chunk_size, total_chunks):
                 self.log_error(f"Failed to upload chunks for {filename}")
                 return False
             
             # Step 2: Complete the chunked upload
-            if not self._complete_chunked_upload(upload_id, filename, total_chunks, folder_path):
+            if not await self._complete_chunked_upload(upload_id, filename, total_chunks, folder_path):
                 self.log_error(f"Failed to complete chunked upload for {filename}")
                 return False
             
@@ -428,64 +590,101 @@ class AIWaveriderProcessor(BaseProcessor):
             self.log_error(f"Error uploading large {file_type} to AIWaverider Drive: {str(e)}")
             return False
     
-    def _upload_file_chunks(self, file_path: str, upload_id: str, chunk_size: int, total_chunks: int) -> bool:
-        """Upload file in chunks to the chunked upload endpoint"""
+    async def _upload_file_chunks(self, file_path: str, upload_id: str, chunk_size: int, total_chunks: int) -> bool:
+        """Upload file chunks concurrently to the chunked upload endpoint"""
         try:
-            headers = {
-                'Authorization': f'Bearer {self.token}'
-            }
-            
             # Get the chunked upload URL
             chunked_upload_url = self.upload_url.replace('/webhook/files/upload', '/webhook/files/upload-chunk')
+            session = self._session
+            semaphore = asyncio.Semaphore(self.chunk_concurrency)
             
-            with open(file_path, 'rb') as file:
-                for chunk_number in range(1, total_chunks + 1):
-                    # Read chunk data
-                    chunk_data = file.read(chunk_size)
-                    if not chunk_data:
-                        break
-                    
-                    self.log_step(f"Uploading chunk {chunk_number}/{total_chunks} for upload_id: {upload_id}")
-                    
-                    # Prepare chunk upload data
-                    files = {
-                        'file': (f'chunk_{chunk_number}', chunk_data, 'application/octet-stream')
-                    }
-                    data = {
-                        'upload_id': upload_id,
-                        'chunk_number': str(chunk_number),
-                        'total_chunks': str(total_chunks)
-                    }
-                    
-                    # Upload chunk
-                    response = self._session.post(
+            async def upload_chunk(file_view: memoryview, chunk_number: int) -> bool:
+                async with semaphore:
+                    offset = (chunk_number - 1) * chunk_size
+                    # Slice the mapped file rather than copying each chunk onto the heap
+                    with file_view[offset:offset + chunk_size] as chunk_data:
+                        return await post_chunk(chunk_data, chunk_number)
+            
+            async def post_chunk(chunk_data: memoryview, chunk_number: int) -> bool:
+                self.log_step(f"Uploading chunk {chunk_number}/{total_chunks} for upload_id: {upload_id}")
+                
+                # Prepare chunk upload data
+                data = aiohttp.FormData()
+                data.add_field('upload_id', upload_id)
+                data.add_field('chunk_number', str(chunk_number))
+                data.add_field('total_chunks', str(total_chunks))
+                data.add_field('file', chunk_data, filename=f'chunk_{chunk_number}', content_type='application/octet-stream')
+                
+                # Upload chunk
+                try:
+                    async with session.post(
                         chunked_upload_url,
-                        headers=headers,
-                        files=files,
                         data=data,
-                        timeout=60
-                    )
-                    
-                    if response.status_code != 200:
-                        self.log_error(f"Failed to upload chunk {chunk_number}. Status: {response.status_code}, Response: {response.text}")
-                        return False
-                    
-                    self.log_step(f"Successfully uploaded chunk {chunk_number}/{total_chunks}")
+                        timeout=aiohttp.ClientTimeout(total=60)
+                    ) as response:
+                        if response.status != 200:
+                            response_text = await response.text()
+                            self.log_error(f"Failed to upload chunk {chunk_number}. Status: {response.status}, Response: {response_text}")
+                            return False
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    self.log_error(f"Error uploading chunk {chunk_number}: {str(e)}")
+                    return False
+                
+                self.log_step(f"Successfully uploaded chunk {chunk_number}/{total_chunks}")
+                return True
             
-            return True
+            with open(file_path, 'rb') as file, \
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mapped_file.madvise(mmap.MADV_SEQUENTIAL)
+                
+                try:
+                    with memoryview(mapped_file) as file_view:
+                        tasks = [
+                            asyncio.create_task(upload_chunk(file_view, chunk_number))
+                            for chunk_number in range(1, total_chunks + 1)
+                        ]
+                        success = True
+                        try:
+                            for next_done in asyncio.as_completed(tasks):
+                                if not await next_done:
+                                    # The upload can't be completed, so stop sending its chunks
+                                    success = False
+                                    break
+                        finally:
+                            # Every chunk's slice must be released before the view and
+                            # the mapping close, so wait for all of them to finish here
+                            await self._cancel_and_wait(tasks)
+                finally:
+                    # Large videos are read once per run; drop them from the page cache
+                    # afterwards so they don't evict data that will be read again
+                    if total_chunks * chunk_size >= self.drop_cache_threshold and hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            
+            return success
             
         except Exception as e:
             self.log_error(f"Error uploading file chunks: {str(e)}")
             return False
     
-    def _complete_chunked_upload(self, upload_id: str, filename: str, total_chunks: int, folder_path: str) -> bool:
+    @staticmethod
+    async def _cancel_and_wait(tasks: List[asyncio.Task]) -> None:
+        """Cancel tasks and wait until all of them have finished, even if cancelled meanwhile"""
+        for task in tasks:
+            task.cancel()
+        cancelled = False
+        while True:
+            try:
+                await asyncio.gather(*tasks, return_exceptions=True)
+                break
+            except asyncio.CancelledError:
+                cancelled = True
+        if cancelled:
+            raise asyncio.CancelledError()
+    
+    async def _complete_chunked_upload(self, upload_id: str, filename: str, total_chunks: int, folder_path: str) -> bool:
         """Complete the chunked upload process"""
         try:
-            headers = {
-                'Authorization': f'Bearer {self.token}',
-                'Content-Type': 'application/json'
-            }
-            
             # Prepare the complete chunked upload request body
             chunked_upload_data = {
                 "upload_id": upload_id,
@@ -500,19 +699,19 @@ class AIWaveriderProcessor(BaseProcessor):
             self.log_step(f"Completing chunked upload for: {filename}")
             self.log_step(f"Request data: {chunked_upload_data}")
             
-            response = self._session.post(
+            async with self._session.post(
                 chunked_upload_url,
-                headers=headers,
                 json=chunked_upload_data,
-                timeout=300
-            )
+                timeout=aiohttp.ClientTimeout(total=300)
+            ) as response:
+                response_text = await response.text()
             
-            if response.status_code == 200:
+            if response.status == 200:
                 self.log_step(f"Successfully completed chunked upload for: {filename}")
-                self.log_step(f"Response: {response.text}")
+                self.log_step(f"Response: {response_text}")
                 return True
             else:
-                self.log_error(f"Failed to complete chunked upload for {filename}. Status: {response.status_code}, Response: {response.text}")
+                self.log_error(f"Failed to complete chunked upload for {filename}. Status: {response.status}, Response: {response_text}")
                 return False
                 
         except Exception as e:
@@ -523,8 +722,8 @@ class AIWaveriderProcessor(BaseProcessor):
         """Cleanup AIWaverider processor resources"""
         try:
             self.log_step("Cleaning up AIWaverider processor")
-            if self._session:
-                self._session.close()
+            if self._session and not self._session.closed:
+                await self._session.close()
             self.status = "idle"
             self.log_step("AIWaverider processor cleanup completed")
         except Exception as e:
@@ -6,9 +6,14 @@ Migrated from full-rounded-url-download-transcription.py
 """
 
 import asyncio
+import csv
+import hashlib
+import json
+import operator
 import os
+import re
 import sys
-import time
+import threading
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
@@ -20,11 +25,14 @@ from system.database import db_manager
 from system.config import settings
 from system.error_recovery import retry_async, RetryConfig, GOOGLE_API_RETRY_CONFIG
 
-# Excel libraries
-import pandas as pd
-from openpyxl import Workbook, load_workbook
+# Excel libraries (openpyxl's write-only mode is the fallback without xlsxwriter)
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+from openpyxl import Workbook
+from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.datavalidation import DataValidation
-from openpyxl.utils.exceptions import InvalidFileException
 
 # Google Drive API
 from google.oauth2.credentials import Credentials
@@ -32,11 +40,113 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
+import google_auth_httplib2
+import httplib2
+
+# Whitespace-separated words, counted without building a list of them
+_WORD_RE = re.compile(r"\S+")
+
+# Video columns read for each Excel row, fetched with a single C-level call
+_get_video_fields = operator.itemgetter(
+    'smart_name', 'title', 'description', 'created_at', 'username', 'uploader_id', 'channel_id',
+    'channel_url', 'video_id', 'platform', 'duration', 'width', 'height', 'fps', 'format_id', 'view_count',
+    'like_count', 'comment_count', 'upload_date', 'file_path', 'transcription_text', 'webpage_url',
+    'transcription_status'
+)
+
+
+class _WriteOnlyWorkbook:
+    """openpyxl write-only workbook with the xlsxwriter calls the export uses
+    
+    Rows are streamed to the file as they are appended instead of being kept
+    as Cell objects, so rows must be written in order.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.workbook = Workbook(write_only=True)
+        self.worksheet = self.workbook.create_sheet("Videos")
+    
+    def data_validation(self, first_row: int, first_col: int, last_row: int, last_col: int, options: Dict) -> None:
+        # Must be added before any row is appended in write-only mode
+        validation = DataValidation(
+            type=options['validate'],
+            formula1='"{}"'.format(",".join(options['source'])),
+            allow_blank=options.get('ignore_blank', True)
+        )
+        self.worksheet.add_data_validation(validation)
+        validation.add(f"{get_column_letter(first_col + 1)}{first_row + 1}:{get_column_letter(last_col + 1)}{last_row + 1}")
+    
+    def write_row(self, row: int, col: int, data: List[Any]) -> None:
+        self.worksheet.append(data)
+    
+    def close(self) -> None:
+        self.workbook.save(self.path)
+
+
+class _CsvWorkbook:
+    """CSV writer with the xlsxwriter calls the export uses
+    
+    Used for the CSV export format, where Drive converts the upload into a
+    Google Sheet; CSV has no data validation, so that call is a no-op.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(path, 'w', encoding='utf-8', newline='')
+        self.writer = csv.writer(self.file)
+    
+    def data_validation(self, first_row: int, first_col: int, last_row: int, last_col: int, options: Dict) -> None:
+        pass
+    
+    def write_row(self, row: int, col: int, data: List[Any]) -> None:
+        self.writer.writerow(data)
+    
+    def close(self) -> None:
+        self.file.close()
 
 
 class ExcelProcessor(BaseProcessor):
     """Handles comprehensive Excel file generation and Google Drive upload"""
     
+    # Drive client shared by all instances, since build() parses the whole
+    # discovery document; rebuilt when its credentials stop being valid
+    _drive_service: Optional[Any] = None
+    _drive_creds: Optional[Credentials] = None
+    # Thread lock rather than asyncio.Lock: the class outlives any one event loop,
+    # and the service is only built and refreshed inside worker threads
+    _drive_service_lock = threading.Lock()
+    # Authorized transport per worker thread (httplib2 is not thread-safe), kept
+    # so Drive calls reuse the open TLS connection instead of reconnecting
+    _drive_http = threading.local()
+    
+    # Excel columns definition - matching the old implementation exactly
+    COLUMNS = (
+        # Basic Info
+        "Index", "Generated Name", "Original Title", "Description", "Date Processed",
+        
+        # Creator Info  
+        "Username", "Uploader ID", "Channel ID", "Channel URL",
+        
+        # Video Details
+        "Video ID", "Platform", "Duration (seconds)", "Resolution", "FPS", "Format",
+        
+        # Engagement Metrics
+        "View Count", "Like Count", "Comment Count", "Upload Date",
+        
+        # File Information
+        "Video File Size (MB)", "Video Path", "Thumbnail Path", "Transcript Path", "Audio Path",
+        
+        # Content
+        "Transcript", "Transcript Word Count",
+        
+        # Processing Info
+        "Source URL", "Status", "Processing Time (seconds)", "Notes", "Error Details"
+    )
+    STATUS_COLUMN = COLUMNS.index("Status")
+    # Allowed values offered by the Status column's drop-down
+    STATUS_OPTIONS = ("In Progress", "Completed", "Failed", "Needs Review", "Skipped")
+    
     def __init__(self):
         super().__init__("ExcelProcessor")
         self.processed_count = 0
@@ -45,7 +155,16 @@ class ExcelProcessor(BaseProcessor):
         # Configuration
         self.transcripts_dir = "assets/downloads/transcripts"
         self.excel_filename = os.getenv("EXCEL_FILENAME", "video_transcripts.xlsx")
+        # "csv" skips the local XLSX build and lets Drive convert the upload into a Google Sheet
+        self.export_format = os.getenv("EXCEL_EXPORT_FORMAT", "xlsx").lower()
+        if self.export_format == "csv":
+            self.excel_filename = f"{os.path.splitext(self.excel_filename)[0]}.csv"
         self.excel_file_path = os.path.join(self.transcripts_dir, self.excel_filename)
+        # Drive folder IDs by folder name, cached so the folder search runs once
+        self._folder_id_cache_path = os.path.join(self.transcripts_dir, ".drive_folder_id")
+        self._drive_folder_id = None
+        # Database signature of the last uploaded export, to skip unchanged runs
+        self.export_state_path = f"{self.excel_file_path}.state"
         # Use a specific folder for Excel files, not the general GOOGLE_DRIVE_FOLDER env var
         self.drive_folder = "VideoTranscripts"
         self.log_step(f"Excel processor initialized with drive folder: {self.drive_folder}")
@@ -55,29 +174,9 @@ class ExcelProcessor(BaseProcessor):
         self.credentials_file = settings.google_credentials_file
         self.token_file = settings.google_token_file
         
-        # Excel columns definition - matching the old implementation exactly
-        self.columns = [
-            # Basic Info
-            "Index", "Generated Name", "Original Title", "Description", "Date Processed",
-            
-            # Creator Info  
-            "Username", "Uploader ID", "Channel ID", "Channel URL",
-            
-            # Video Details
-            "Video ID", "Platform", "Duration (seconds)", "Resolution", "FPS", "Format",
-            
-            # Engagement Metrics
-            "View Count", "Like Count", "Comment Count", "Upload Date",
-            
-            # File Information
-            "Video File Size (MB)", "Video Path", "Thumbnail Path", "Transcript Path", "Audio Path",
-            
-            # Content
-            "Transcript", "Transcript Word Count",
-            
-            # Processing Info
-            "Source URL", "Status", "Processing Time (seconds)", "Notes", "Error Details"
-        ]
+        # Bound concurrent Drive uploads when several files are uploaded at once
+        self._upload_semaphore = asyncio.Semaphore(int(os.getenv("DRIVE_CONCURRENCY", "8")))
+        self.upload_chunk_size = 8 * 1024 * 1024  # 8MB resumable upload chunks
     
     async def initialize(self) -> bool:
         """Initialize Excel processor"""
@@ -106,16 +205,23 @@ class ExcelProcessor(BaseProcessor):
             self.log_step("Starting Excel file generation and upload")
             self.status = "processing"
             
-            # Get all videos and thumbnails from database
-            videos = await db_manager.get_all_videos()
-            thumbnails = await db_manager.get_all_thumbnails()
+            # Nothing to do if no video or thumbnail changed since the last upload
+            signature = await db_manager.get_export_signature()
+            if os.path.exists(self.excel_file_path) and signature == self._load_export_signature():
+                self.status = "completed"
+                self.log_step("Excel file is up to date with the database, skipping generation and upload")
+                return True
             
-            if not videos:
+            video_count = signature[0]
+            if not video_count:
                 self.log_step("No videos found to include in Excel file")
                 return True
             
+            # Thumbnails are needed for every row; videos are streamed from the database
+            thumbnails = await db_manager.get_all_thumbnails()
+            
             # Generate Excel file
-            excel_path = await self._generate_excel_file(videos, thumbnails)
+            excel_path = await self._generate_excel_file(video_count, thumbnails)
             if not excel_path:
                 self.log_error("Failed to generate Excel file")
                 return False
@@ -123,7 +229,8 @@ class ExcelProcessor(BaseProcessor):
             # Upload to Google Drive
             upload_success = await self._upload_excel_to_drive(excel_path)
             if upload_success:
-                self.processed_count = len(videos)
+                self._save_export_signature(signature)
+                self.processed_count = video_count
                 self.status = "completed"
                 self.log_step(f"Excel file generated and uploaded successfully with {self.processed_count} entries")
                 return True
@@ -138,34 +245,50 @@ class ExcelProcessor(BaseProcessor):
             self.status = "error"
             return False
     
-    async def _generate_excel_file(self, videos: List[Dict], thumbnails: List[Dict]) -> Optional[str]:
+    def _load_export_signature(self) -> Optional[List[Any]]:
+        """Load the database signature recorded by the last successful upload"""
+        try:
+            with open(self.export_state_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('signature')
+        except (OSError, ValueError):
+            return None
+    
+    def _save_export_signature(self, signature: List[Any]) -> None:
+        """Record the database signature of a successfully uploaded export"""
+        try:
+            with open(self.export_state_path, 'w', encoding='utf-8') as f:
+                json.dump({'signature': signature}, f)
+        except OSError as e:
+            self.log_error(f"Error saving Excel export state: {str(e)}")
+    
+    async def _generate_excel_file(self, video_count: int, thumbnails: List[Dict]) -> Optional[str]:
         """Generate comprehensive Excel file with video data"""
         try:
-            self.log_step(f"Generating Excel file with {len(videos)} videos")
-            
-            # Create or load workbook
-            wb, ws = await self._get_or_create_workbook()
-            
-            # Process each video
-            for index, video in enumerate(videos, 1):
-                # Find matching thumbnail
-                video_filename = video.get('filename', '')
-                base_name = os.path.splitext(video_filename)[0]
-                matching_thumbnail = None
-                
-                for thumbnail in thumbnails:
-                    if base_name in thumbnail.get('filename', '') or base_name in thumbnail.get('video_filename', ''):
-                        matching_thumbnail = thumbnail
-                        break
-                
-                # Prepare video data
-                video_data = await self._prepare_video_data(video, matching_thumbnail, index)
-                
-                # Add row to Excel
-                await self._add_video_row(ws, video_data)
+            self.log_step(f"Generating Excel file with {video_count} videos")
+            
+            # The file is regenerated from the database on every run rather than
+            # loading the previous workbook and appending to it. Videos are read and
+            # written in batches, and constant_memory mode flushes each finished row
+            # to disk, so memory stays bounded by the batch size, not the catalog
+            workbook, worksheet = self._create_workbook()
+            thumbnails_by_base = self._index_thumbnails(thumbnails)
+            # Names for the partial-match fallback, read once rather than per video
+            thumbnail_names = [
+                (thumbnail.get('filename') or '', thumbnail.get('video_filename') or '', thumbnail)
+                for thumbnail in thumbnails
+            ]
             
-            # Save workbook
-            wb.save(self.excel_file_path)
+            # Row building stats every video file and the writes go to disk, so
+            # each batch is written in a worker thread off the event loop
+            next_index = 1
+            file_sizes, scanned_dirs = {}, set()
+            async for videos in db_manager.iter_all_videos():
+                next_index = await asyncio.to_thread(
+                    self._write_video_rows, worksheet, videos, thumbnail_names, thumbnails_by_base,
+                    next_index, file_sizes, scanned_dirs
+                )
+            
+            await asyncio.to_thread(workbook.close)
             self.log_step(f"Excel file saved: {self.excel_file_path}")
             
             return self.excel_file_path
@@ -174,161 +297,147 @@ class ExcelProcessor(BaseProcessor):
             self.log_error("Error generating Excel file", e)
             return None
     
-    async def _get_or_create_workbook(self) -> tuple:
-        """Get existing workbook or create new one"""
-        try:
-            if os.path.exists(self.excel_file_path):
-                try:
-                    wb = load_workbook(self.excel_file_path)
-                    ws = wb.active
-                    self.log_step("Loaded existing Excel file")
-                    return wb, ws
-                except InvalidFileException:
-                    # Backup corrupted file
-                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                    backup_path = f"{self.excel_file_path}.backup_{timestamp}"
-                    os.rename(self.excel_file_path, backup_path)
-                    self.log_step(f"Moved corrupted Excel file to: {backup_path}")
-                    
-                    wb = Workbook()
-                    ws = wb.active
-                    await self._setup_workbook(wb, ws)
-                    return wb, ws
-            else:
-                wb = Workbook()
-                ws = wb.active
-                await self._setup_workbook(wb, ws)
-                return wb, ws
-                
-        except Exception as e:
-            self.log_error("Error getting/creating workbook", e)
-            raise
+    def _create_workbook(self) -> tuple:
+        """Create the workbook with headers and Status validation"""
+        if self.export_format == "csv":
+            workbook = worksheet = _CsvWorkbook(self.excel_file_path)
+        elif xlsxwriter is not None:
+            workbook = xlsxwriter.Workbook(self.excel_file_path, {
+                'constant_memory': True,
+                'strings_to_urls': False
+            })
+            # Pin the creation date (otherwise the current time) so unchanged data
+            # produces a byte-identical file whose MD5 matches the one on Drive
+            workbook.set_properties({'created': datetime(2000, 1, 1)})
+            worksheet = workbook.add_worksheet("Videos")
+        else:
+            workbook = worksheet = _WriteOnlyWorkbook(self.excel_file_path)
+        
+        # Add data validation for Status column
+        worksheet.data_validation(1, self.STATUS_COLUMN, 1048575, self.STATUS_COLUMN, {
+            'validate': 'list',
+            'source': list(self.STATUS_OPTIONS),
+            'ignore_blank': False
+        })
+        
+        # Add headers
+        worksheet.write_row(0, 0, self.COLUMNS)
+        return workbook, worksheet
     
-    async def _setup_workbook(self, wb: Workbook, ws) -> None:
-        """Setup workbook with headers and validation"""
-        try:
-            # Add headers
-            ws.append(self.columns)
-            
-            # Add data validation for Status column
-            status_validation = DataValidation(
-                type="list", 
-                formula1='"In Progress,Completed,Failed,Needs Review,Skipped"', 
-                allow_blank=False
-            )
-            ws.add_data_validation(status_validation)
-            status_validation.add("V2:V1048576")  # Status column
-            
-            self.log_step("Workbook setup completed with headers and validation")
-            
-        except Exception as e:
-            self.log_error("Error setting up workbook", e)
-            raise
+    @staticmethod
+    def _index_thumbnails(thumbnails: List[Dict]) -> Dict[str, Dict]:
+        """Index thumbnails by the base names they can match on, keeping the first one"""
+        thumbnails_by_base = {}
+        for thumbnail in thumbnails:
+            for name in (thumbnail.get('filename'), thumbnail.get('video_filename')):
+                if name:
+                    thumbnails_by_base.setdefault(os.path.splitext(name)[0], thumbnail)
+        return thumbnails_by_base
     
-    async def _prepare_video_data(self, video: Dict, thumbnail: Optional[Dict], index: int) -> Dict[str, Any]:
-        """Prepare comprehensive video data for Excel row"""
-        try:
-            # Get transcript text
-            transcript_text = video.get('transcription_text', '')
-            word_count = len(transcript_text.split()) if transcript_text else 0
-            
-            # Calculate resolution
-            resolution = ""
-            if video.get('width') and video.get('height'):
-                resolution = f"{video['width']}x{video['height']}"
-            
-            # Get file size in MB
-            file_size_mb = 0
-            if video.get('file_path') and os.path.exists(video.get('file_path', '')):
-                file_size_mb = os.path.getsize(video.get('file_path', '')) / (1024 * 1024)
-            
-            # Prepare comprehensive data with all metadata
-            video_data = {
-                'index': index,
-                'generated_name': video.get('smart_name', ''),
-                'title': video.get('title', ''),
-                'description': video.get('description', ''),
-                'date_processed': video.get('created_at', ''),
-                'username': video.get('username', ''),
-                'uploader_id': video.get('uploader_id', ''),
-                'channel_id': video.get('channel_id', ''),
-                'channel_url': video.get('channel_url', ''),
-                'video_id': video.get('video_id', ''),
-                'platform': video.get('platform', ''),
-                'duration': video.get('duration', 0),
-                'resolution': resolution,
-                'fps': video.get('fps', ''),
-                'format': video.get('format_id', ''),
-                'view_count': video.get('view_count', ''),
-                'like_count': video.get('like_count', ''),
-                'comment_count': video.get('comment_count', ''),
-                'upload_date': video.get('upload_date', ''),
-                'file_size_mb': f"{file_size_mb:.2f}",
-                'video_path': video.get('file_path', ''),
-                'thumbnail_path': thumbnail.get('file_path', '') if thumbnail else '',
-                'transcript_path': f"{video.get('smart_name', '')}.txt" if video.get('smart_name') else '',
-                'audio_path': '',  # Not stored in database
-                'transcript': transcript_text,
-                'word_count': word_count,
-                'source_url': video.get('webpage_url', video.get('url', '')),
-                'status': 'Completed' if video.get('transcription_status') == 'COMPLETED' else 'Pending',
-                'processing_time': 0,  # Not tracked in database
-                'notes': '',
-                'error_details': ''
-            }
-            
-            return video_data
+    def _write_video_rows(self, worksheet, videos: List[Dict], thumbnail_names: List[tuple],
+                          thumbnails_by_base: Dict[str, Dict], first_index: int,
+                          file_sizes: Dict[str, int], scanned_dirs: set) -> int:
+        """Write a batch of video rows, returning the index of the next row"""
+        self._scan_file_sizes(videos, file_sizes, scanned_dirs)
+        
+        write_row = worksheet.write_row
+        prepare_video_row = self._prepare_video_row
+        index = first_index
+        for video in videos:
+            # Find matching thumbnail
+            base_name = os.path.splitext(video.get('filename', ''))[0]
+            matching_thumbnail = thumbnails_by_base.get(base_name)
+            
+            if matching_thumbnail is None and base_name:
+                # Fall back to a partial match, e.g. a thumbnail renamed with a "_1" suffix
+                for filename, video_filename, thumbnail in thumbnail_names:
+                    if base_name in filename or base_name in video_filename:
+                        matching_thumbnail = thumbnail
+                        break
             
-        except Exception as e:
-            self.log_error("Error preparing video data", e)
-            return {}
+            write_row(index, 0, prepare_video_row(video, matching_thumbnail, index, file_sizes))
+            index += 1
+        return index
     
-    async def _add_video_row(self, ws, video_data: Dict[str, Any]) -> None:
-        """Add video data as row to worksheet"""
-        try:
-            row_data = [
-                video_data.get('index', ''),
-                video_data.get('generated_name', ''),
-                video_data.get('title', ''),
-                video_data.get('description', ''),
-                video_data.get('date_processed', ''),
-                video_data.get('username', ''),
-                video_data.get('uploader_id', ''),
-                video_data.get('channel_id', ''),
-                video_data.get('channel_url', ''),
-                video_data.get('video_id', ''),
-                video_data.get('platform', ''),
-                video_data.get('duration', 0),
-                video_data.get('resolution', ''),
-                video_data.get('fps', ''),
-                video_data.get('format', ''),
-                video_data.get('view_count', ''),
-                video_data.get('like_count', ''),
-                video_data.get('comment_count', ''),
-                video_data.get('upload_date', ''),
-                video_data.get('file_size_mb', ''),
-                video_data.get('video_path', ''),
-                video_data.get('thumbnail_path', ''),
-                video_data.get('transcript_path', ''),
-                video_data.get('audio_path', ''),
-                video_data.get('transcript', ''),  # Full transcript
-                video_data.get('word_count', 0),
-                video_data.get('source_url', ''),
-                video_data.get('status', 'In Progress'),
-                video_data.get('processing_time', 0),
-                video_data.get('notes', ''),
-                video_data.get('error_details', '')
-            ]
-            
-            ws.append(row_data)
-            
-            # Apply validation to new row
-            new_row = ws.max_row
-            # Note: Data validation is already applied to the entire column range
-            # No need to add validation to individual rows
-            
-        except Exception as e:
-            self.log_error("Error adding video row", e)
+    @staticmethod
+    def _scan_file_sizes(videos: List[Dict], file_sizes: Dict[str, int], scanned_dirs: set) -> None:
+        """Record the size of every file in the videos' directories with one scan per directory"""
+        for video in videos:
+            file_path = video.get('file_path')
+            if not file_path or file_path in file_sizes:
+                continue
+            directory = os.path.dirname(file_path)
+            if directory in scanned_dirs:
+                continue
+            scanned_dirs.add(directory)
+            try:
+                with os.scandir(directory or '.') as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            file_sizes[os.path.join(directory, entry.name)] = entry.stat().st_size
+            except OSError:
+                continue
+    
+    def _prepare_video_row(self, video: Dict, thumbnail: Optional[Dict], index: int,
+                           file_sizes: Dict[str, int]) -> List[Any]:
+        """Prepare comprehensive video data as an Excel row in column order"""
+        # Every videos column is present in a database row, so all fields come out in one call
+        (smart_name, title, description, created_at, username, uploader_id, channel_id,
+         channel_url, video_id, platform, duration, width, height, fps, format_id, view_count,
+         like_count, comment_count, upload_date, file_path, transcript_text, source_url,
+         transcription_status) = _get_video_fields(video)
+        
+        # Get transcript word count
+        word_count = sum(1 for _ in _WORD_RE.finditer(transcript_text)) if transcript_text else 0
+        
+        # Calculate resolution
+        resolution = f"{width}x{height}" if width and height else ""
+        
+        # Get file size in MB (from the directory scan; stat only paths it didn't see)
+        file_size_mb = 0
+        if file_path:
+            file_size = file_sizes.get(file_path)
+            if file_size is None:
+                try:
+                    file_size = os.stat(file_path).st_size
+                except OSError:
+                    file_size = 0
+            file_size_mb = file_size / (1024 * 1024)
+        
+        # Prepare comprehensive data with all metadata
+        return [
+            index,
+            smart_name,
+            title,
+            description,
+            created_at,
+            username,
+            uploader_id,
+            channel_id,
+            channel_url,
+            video_id,
+            platform,
+            duration,
+            resolution,
+            fps,
+            format_id,
+            view_count,
+            like_count,
+            comment_count,
+            upload_date,
+            f"{file_size_mb:.2f}",
+            file_path,
+            thumbnail.get('file_path', '') if thumbnail else '',
+            f"{smart_name}.txt" if smart_name else '',
+            '',  # Audio path is not stored in database
+            transcript_text,  # Full transcript
+            word_count,
+            source_url,
+            'Completed' if transcription_status == 'COMPLETED' else 'Pending',
+            0,  # Processing time is not tracked in database
+            '',
+            ''
+        ]
     
     @retry_async(GOOGLE_API_RETRY_CONFIG)
     async def _upload_excel_to_drive(self, excel_path: str) -> bool:
@@ -340,14 +449,26 @@ class ExcelProcessor(BaseProcessor):
             if not service:
                 return False
             
-            # Create or find folder
-            folder_id = await self._get_or_create_drive_folder(service)
+            # Create or find folder (the folder ID is cached between runs)
+            folder_id = self._load_cached_folder_id()
+            from_cache = folder_id is not None
+            if not folder_id:
+                folder_id = await self._get_or_create_drive_folder(service)
             if not folder_id:
                 return False
             
             # Upload file
             file_id = await self._upload_file_to_drive(service, excel_path, folder_id)
+            if not file_id and from_cache:
+                # The cached folder may have been deleted; look it up again once
+                self.log_step("Upload to cached Drive folder failed, refreshing folder ID")
+                self._save_cached_folder_id(None)
+                folder_id = await self._get_or_create_drive_folder(service)
+                if folder_id:
+                    file_id = await self._upload_file_to_drive(service, excel_path, folder_id)
+            
             if file_id:
+                self._save_cached_folder_id(folder_id)
                 self.log_step(f"Successfully uploaded Excel file to Google Drive")
                 return True
             else:
@@ -358,8 +479,71 @@ class ExcelProcessor(BaseProcessor):
             self.log_error("Error uploading Excel to Drive", e)
             return False
     
+    def _load_cached_folder_id(self) -> Optional[str]:
+        """Get the cached Drive folder ID for self.drive_folder"""
+        if self._drive_folder_id is None:
+            try:
+                with open(self._folder_id_cache_path, 'r', encoding='utf-8') as f:
+                    self._drive_folder_id = json.load(f).get(self.drive_folder)
+            except (OSError, ValueError):
+                return None
+        return self._drive_folder_id
+    
+    def _save_cached_folder_id(self, folder_id: Optional[str]) -> None:
+        """Cache (or with None, forget) the Drive folder ID for self.drive_folder"""
+        if folder_id == self._drive_folder_id:
+            return
+        self._drive_folder_id = folder_id
+        try:
+            cache = {}
+            if os.path.exists(self._folder_id_cache_path):
+                with open(self._folder_id_cache_path, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+            if folder_id:
+                cache[self.drive_folder] = folder_id
+            else:
+                cache.pop(self.drive_folder, None)
+            with open(self._folder_id_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except (OSError, ValueError) as e:
+            self.log_error(f"Error saving Drive folder ID cache: {str(e)}")
+    
     async def _get_drive_service(self) -> Optional[Any]:
-        """Get authenticated Google Drive service"""
+        """Get authenticated Google Drive service, shared by all instances"""
+        service, creds = ExcelProcessor._drive_service, ExcelProcessor._drive_creds
+        if service is not None and creds.valid:
+            return service
+        # Token refresh, the OAuth flow and build() all block, so run them in a worker thread
+        return await asyncio.to_thread(self._get_shared_drive_service)
+    
+    def _get_shared_drive_service(self) -> Optional[Any]:
+        """Refresh or rebuild the shared Drive service under the class lock"""
+        with ExcelProcessor._drive_service_lock:
+            creds = ExcelProcessor._drive_creds
+            if ExcelProcessor._drive_service is not None and not creds.valid and creds.expired and creds.refresh_token:
+                # Refresh the in-process credentials (the service holds the same object),
+                # touching the token file only to save the refreshed token
+                if not self._refresh_credentials(creds):
+                    ExcelProcessor._drive_service = None
+            
+            if ExcelProcessor._drive_service is None or not ExcelProcessor._drive_creds.valid:
+                ExcelProcessor._drive_service, ExcelProcessor._drive_creds = self._build_drive_service()
+            return ExcelProcessor._drive_service
+    
+    def _refresh_credentials(self, creds: Credentials) -> bool:
+        """Refresh expired credentials in place and save them to the token file"""
+        try:
+            creds.refresh(Request())
+            with open(self.token_file, 'w') as token:
+                token.write(creds.to_json())
+            self.log_step("Successfully refreshed credentials")
+            return True
+        except Exception as e:
+            self.log_error(f"Error refreshing credentials: {str(e)}")
+            return False
+    
+    def _build_drive_service(self) -> tuple:
+        """Build an authenticated Google Drive service, returning it with its credentials"""
         try:
             creds = None
             if os.path.exists(self.token_file):
@@ -372,13 +556,7 @@ class ExcelProcessor(BaseProcessor):
                     
             if not creds or not creds.valid:
                 if creds and creds.expired and creds.refresh_token:
-                    try:
-                        creds.refresh(Request())
-                        with open(self.token_file, 'w') as token:
-                            token.write(creds.to_json())
-                        self.log_step("Successfully refreshed credentials")
-                    except Exception as e:
-                        self.log_error(f"Error refreshing credentials: {str(e)}")
+                    if not self._refresh_credentials(creds):
                         creds = None
                 
                 # If we still don't have valid creds, start fresh OAuth flow
@@ -397,15 +575,16 @@ class ExcelProcessor(BaseProcessor):
                         self.log_step("New authentication tokens obtained and saved")
                     except Exception as e:
                         self.log_error(f"Error in OAuth flow: {str(e)}")
-                        return None
+                        return None, None
             
-            service = build('drive', 'v3', credentials=creds)
+            # The discovery document ships with the client library, no need for the file cache
+            service = build('drive', 'v3', credentials=creds, static_discovery=True, cache_discovery=False)
             self.log_step("Google Drive service initialized successfully")
-            return service
+            return service, creds
             
         except Exception as e:
             self.log_error(f"Failed to initialize Google Drive service: {str(e)}")
-            return None
+            return None, None
     
     async def _get_or_create_drive_folder(self, service) -> Optional[str]:
         """Get or create Google Drive folder"""
@@ -413,7 +592,7 @@ class ExcelProcessor(BaseProcessor):
             # Search for existing folder
             folder_query = f"name='{self.drive_folder}' and mimeType='application/vnd.google-apps.folder'"
             self.log_step(f"Searching for folder: {self.drive_folder}")
-            results = service.files().list(q=folder_query).execute()
+            results = await self._execute(service.files().list(q=folder_query))
             folders = results.get('files', [])
             
             # Debug: List all found folders
@@ -428,7 +607,7 @@ class ExcelProcessor(BaseProcessor):
             else:
                 # Create new folder
                 folder_metadata = {'name': self.drive_folder, 'mimeType': 'application/vnd.google-apps.folder'}
-                folder = service.files().create(body=folder_metadata).execute()
+                folder = await self._execute(service.files().create(body=folder_metadata))
                 folder_id = folder['id']
                 self.log_step(f"Created new folder: {self.drive_folder}")
                 return folder_id
@@ -443,32 +622,88 @@ class ExcelProcessor(BaseProcessor):
             filename = os.path.basename(file_path)
             file_size = os.path.getsize(file_path)
             
-            self.log_step(f"Uploading file: {filename} ({file_size / (1024*1024):.2f} MB)")
+            # CSV exports are imported as a native Google Sheet named without the extension
+            convert_csv = filename.endswith('.csv')
+            if convert_csv:
+                filename = os.path.splitext(filename)[0]
             
-            # Check if file already exists
-            file_query = f"name='{filename}' and '{folder_id}' in parents"
-            existing = service.files().list(q=file_query).execute().get('files', [])
-            
-            media = MediaFileUpload(file_path, resumable=True)
+            self.log_step(f"Uploading file: {filename} ({file_size / (1024*1024):.2f} MB)")
             
-            if existing:
-                # Update existing file
-                file_id = existing[0]['id']
-                service.files().update(fileId=file_id, media_body=media).execute()
-                self.log_step(f"Updated existing file: {filename}")
-                return file_id
-            else:
-                # Create new file
-                file_metadata = {'name': filename, 'parents': [folder_id]}
-                file = service.files().create(body=file_metadata, media_body=media).execute()
-                file_id = file.get('id')
-                self.log_step(f"Created new file: {filename}")
-                return file_id
+            # Drive calls block, so they run in worker threads; the semaphore
+            # bounds how many files upload at once
+            async with self._upload_semaphore:
+                # Check if file already exists
+                file_query = f"name='{filename}' and '{folder_id}' in parents"
+                existing = (await self._execute(
+                    service.files().list(q=file_query, fields="files(id,md5Checksum)")
+                )).get('files', [])
+                
+                # Skip the upload if Drive already has identical content (converted
+                # Google Sheets have no checksum, so they are always updated)
+                if existing and existing[0].get('md5Checksum'):
+                    if existing[0]['md5Checksum'] == await asyncio.to_thread(self._file_md5, file_path):
+                        self.log_step(f"Drive file is already up to date: {filename}")
+                        return existing[0]['id']
+                
+                media = MediaFileUpload(
+                    file_path,
+                    mimetype='text/csv' if convert_csv else None,
+                    chunksize=self.upload_chunk_size,
+                    resumable=True
+                )
+                
+                if existing:
+                    # Update existing file
+                    file_id = existing[0]['id']
+                    await self._execute_resumable(service.files().update(fileId=file_id, media_body=media))
+                    self.log_step(f"Updated existing file: {filename}")
+                    return file_id
+                else:
+                    # Create new file
+                    file_metadata = {'name': filename, 'parents': [folder_id]}
+                    if convert_csv:
+                        file_metadata['mimeType'] = 'application/vnd.google-apps.spreadsheet'
+                    file = await self._execute_resumable(service.files().create(body=file_metadata, media_body=media))
+                    file_id = file.get('id')
+                    self.log_step(f"Created new file: {filename}")
+                    return file_id
                 
         except Exception as e:
             self.log_error(f"Error uploading file to Drive: {str(e)}")
             return None
     
+    @staticmethod
+    def _file_md5(file_path: str) -> str:
+        """MD5 of a file, read in 1MB blocks, as Drive reports it in md5Checksum"""
+        digest = hashlib.md5(usedforsecurity=False)
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _thread_http() -> google_auth_httplib2.AuthorizedHttp:
+        """Get the calling worker thread's authorized keep-alive transport"""
+        local = ExcelProcessor._drive_http
+        creds = ExcelProcessor._drive_creds
+        if getattr(local, 'creds', None) is not creds:
+            local.http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+            local.creds = creds
+        return local.http
+    
+    async def _execute(self, request) -> Dict[str, Any]:
+        """Execute a Drive request in a worker thread over that thread's connection"""
+        return await asyncio.to_thread(lambda: request.execute(http=self._thread_http()))
+    
+    async def _execute_resumable(self, request) -> Dict[str, Any]:
+        """Send a resumable upload chunk by chunk, each chunk in a worker thread"""
+        response = None
+        while response is None:
+            status, response = await asyncio.to_thread(lambda: request.next_chunk(http=self._thread_http()))
+            if status:
+                self.log_step(f"Upload progress: {int(status.progress() * 100)}%")
+        return response
+    
     async def cleanup(self) -> None:
         """Cleanup Excel processor resources"""
         try:
@@ -6,10 +6,13 @@ Integrates real logic from social_media_processor.py
 """
 
 import asyncio
+import csv
 import os
 import sys
 import json
-import pandas as pd
+import operator
+import sqlite3
+import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 
@@ -26,7 +29,14 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import HttpRequest, MediaFileUpload
+import google_auth_httplib2
+import httplib2
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class SheetsProcessor(BaseProcessor):
@@ -44,12 +54,52 @@ class SheetsProcessor(BaseProcessor):
         self.master_sheet_id = settings.master_sheet_id
         self.master_sheet_name = settings.master_sheet_name
         
-        # Google Sheets service
+        # Google Sheets service, and the Drive service for thumbnail images (built on first use)
         self.service = None
+        self._drive_service = None
+        self._sheet_gid = None  # numeric sheetId of the master sheet tab
+        # spreadsheets.get tab lists by spreadsheet ID, as (fetched at, response)
+        self._sheet_info_cache: Dict[str, tuple] = {}
+        self.sheet_info_ttl = 60.0  # seconds
+        # Sheet row number of each filename, built once per update and kept in step with
+        # appended rows; dropped when duplicate cleanup deletes rows
+        self._filename_row_index: Optional[Dict[str, int]] = None
+        # Appends made by this processor (the only writes that can add duplicates) and the
+        # count at the last duplicate cleanup; an unchanged count within cleanup_interval
+        # means the sheet is still clean
+        self._sheet_generation = 0
+        self._last_cleaned_generation = -1
+        self._last_cleaned_at = 0.0
+        self.cleanup_interval = 300.0  # seconds
+        # Thumbnail images already in Drive by file name, kept between updates
+        # and extended with each image uploaded
+        self._drive_thumb_cache: Optional[Dict[str, str]] = None
+        self._drive_thumb_cache_at = 0.0
+        self.drive_thumb_cache_ttl = 300.0  # seconds
         self.offline_mode = True
+        # Local backup rows are kept in SQLite so each update is an upsert, not a file rewrite;
+        # the JSON file is only read to migrate an existing backup and written on export
         self.local_backup_file = 'master_sheet_backup.json'
+        self.local_backup_db = 'master_sheet_backup.db'
+        self._backup_conn = None
+        # Backup rows waiting to be written by the background flusher, by filename
+        self._backup_pending: Dict[str, Dict] = {}
+        self._backup_dirty = asyncio.Event()
+        self._backup_closing = False
+        self._backup_flush_task: Optional[asyncio.Task] = None
+        self.backup_flush_delay = 1.0  # seconds to gather further updates before writing
         self.local_data = {'rows': {}, 'last_sync': None}
         
+        # Snapshot of the sheet's rows shared by the reads of one update cycle,
+        # dropped after every write
+        self._sheet_cache = {'values': None, 'expires_at': 0.0}
+        self.sheet_cache_ttl = 10.0  # seconds
+        # Rows per values.batchUpdate request, keeping each request's payload bounded
+        self.batch_update_size = 500
+        
+        # Bound concurrent thumbnail uploads to Drive
+        self._thumbnail_semaphore = asyncio.Semaphore(int(os.getenv("DRIVE_CONCURRENCY", "8")))
+        
         # Circuit breaker for Google Sheets API
         self.circuit_breaker = CircuitBreaker(
             failure_threshold=3,
@@ -80,6 +130,15 @@ class SheetsProcessor(BaseProcessor):
             'thumbnail_image',
             'transcription_status'
         ]
+        # Value written for an empty cell, per column: upload statuses default to pending
+        self._column_defaults = tuple(
+            self.STATUS_PENDING if col.startswith('upload_status_') else '' for col in self.SHEET_COLUMNS
+        )
+        # Reads a content_info's values in column order with one C-level call
+        self._get_column_values = operator.itemgetter(*self.SHEET_COLUMNS)
+        # Last header column letter, and whether the header row is known to be complete
+        self._header_last_column = chr(ord('A') + len(self.SHEET_COLUMNS) - 1)
+        self._headers_verified = False
     
     async def initialize(self) -> bool:
         """Initialize sheets processor"""
@@ -102,6 +161,7 @@ class SheetsProcessor(BaseProcessor):
             
             self.offline_mode = False
             self._load_local_backup()
+            self._start_backup_flusher()
             
             self.initialized = True
             self.status = "ready"
@@ -112,6 +172,7 @@ class SheetsProcessor(BaseProcessor):
             self.log_error("Failed to initialize sheets processor", e)
             self.offline_mode = True
             self._load_local_backup()
+            self._start_backup_flusher()
             return True  # Allow offline mode
     
     async def _get_service(self) -> Optional[Any]:
@@ -160,7 +221,7 @@ class SheetsProcessor(BaseProcessor):
             
             # Verify sheet access
             try:
-                service.spreadsheets().get(spreadsheetId=self.master_sheet_id).execute()
+                await self._get_sheet_info(service)
                 self.log_step("Successfully verified sheet access")
             except Exception as e:
                 self.log_error(f"Sheet access verification failed: {str(e)}")
@@ -175,24 +236,116 @@ class SheetsProcessor(BaseProcessor):
     def _load_local_backup(self):
         """Load local backup data"""
         try:
-            if os.path.exists(self.local_backup_file):
-                with open(self.local_backup_file, 'r') as f:
-                    self.local_data = json.load(f)
-            else:
-                self.local_data = {'rows': {}, 'last_sync': None}
+            if self._backup_conn is None:
+                # Written from the flusher's worker thread, one write at a time
+                self._backup_conn = sqlite3.connect(self.local_backup_db, check_same_thread=False)
+                self._backup_conn.execute("PRAGMA journal_mode=WAL")
+                self._backup_conn.execute("PRAGMA synchronous=NORMAL")
+                self._backup_conn.execute(
+                    "CREATE TABLE IF NOT EXISTS rows (filename TEXT PRIMARY KEY, data TEXT, updated_at REAL)"
+                )
+            
+            rows = {
+                filename: orjson.loads(data) if orjson else json.loads(data)
+                for filename, data in self._backup_conn.execute("SELECT filename, data FROM rows")
+            }
+            self.local_data = {'rows': rows, 'last_sync': None}
+            
+            # Migrate a backup written by the JSON-file implementation
+            if not rows and os.path.exists(self.local_backup_file):
+                with open(self.local_backup_file, 'rb') as f:
+                    raw = f.read()
+                legacy_rows = (orjson.loads(raw) if orjson else json.loads(raw)).get('rows', {})
+                if legacy_rows:
+                    self._write_backup_rows(list(legacy_rows.values()))
+                    self.local_data['rows'] = legacy_rows
+                    self.log_step(f"Migrated {len(legacy_rows)} rows from {self.local_backup_file}")
         except Exception as e:
             self.log_error(f"Error loading local backup: {str(e)}")
             self.local_data = {'rows': {}, 'last_sync': None}
     
-    def _save_local_backup(self):
-        """Save local backup data"""
+    def _save_local_backup(self, content_list: List[Dict]):
+        """Save the given rows to the local backup
+        
+        The rows are queued and written by the background flusher, so a burst of
+        updates costs one write; without a running flusher they are written now.
+        """
+        for content_info in content_list:
+            self._backup_pending[content_info['filename']] = content_info
+        if self._backup_flush_task is None:
+            self._write_backup_rows(self._take_backup_pending())
+        else:
+            self._backup_dirty.set()
+    
+    def _take_backup_pending(self) -> List[Dict]:
+        """Take the queued backup rows, leaving the queue empty"""
+        rows = list(self._backup_pending.values())
+        self._backup_pending = {}
+        return rows
+    
+    def _start_backup_flusher(self) -> None:
+        """Start the task that writes queued backup rows in the background"""
+        if self._backup_flush_task is None:
+            self._backup_closing = False
+            self._backup_flush_task = asyncio.create_task(self._backup_flusher())
+    
+    async def _backup_flusher(self) -> None:
+        """Write queued backup rows in a worker thread, coalescing bursts of updates"""
+        while True:
+            await self._backup_dirty.wait()
+            if not self._backup_closing:
+                await asyncio.sleep(self.backup_flush_delay)
+            self._backup_dirty.clear()
+            
+            rows = self._take_backup_pending()
+            if rows:
+                await asyncio.to_thread(self._write_backup_rows, rows)
+            if self._backup_closing:
+                return
+    
+    async def _stop_backup_flusher(self) -> None:
+        """Write any queued backup rows and stop the flusher"""
+        if self._backup_flush_task is None:
+            return
+        self._backup_closing = True
+        self._backup_dirty.set()
+        await self._backup_flush_task
+        self._backup_flush_task = None
+    
+    def _write_backup_rows(self, content_list: List[Dict]):
+        """Upsert rows into the local backup database"""
         try:
-            with open(self.local_backup_file, 'w') as f:
-                json.dump(self.local_data, f, indent=2)
+            if self._backup_conn is None:
+                self.log_error("Local backup is not open, rows not saved")
+                return
+            now = time.time()
+            with self._backup_conn:
+                self._backup_conn.executemany(
+                    "INSERT OR REPLACE INTO rows (filename, data, updated_at) VALUES (?, ?, ?)",
+                    [(content_info['filename'], self._dumps_row(content_info), now) for content_info in content_list]
+                )
             self.log_step("Local backup saved successfully")
         except Exception as e:
             self.log_error(f"Error saving local backup: {str(e)}")
     
+    @staticmethod
+    def _dumps_row(content_info: Dict) -> str:
+        """Serialize a backup row to JSON text"""
+        return orjson.dumps(content_info).decode('utf-8') if orjson else json.dumps(content_info)
+    
+    def export_local_backup(self, path: Optional[str] = None) -> Optional[str]:
+        """Write the local backup out as JSON in the old master_sheet_backup.json layout"""
+        path = path or self.local_backup_file
+        try:
+            raw = (orjson.dumps(self.local_data, option=orjson.OPT_INDENT_2) if orjson
+                   else json.dumps(self.local_data, indent=2).encode('utf-8'))
+            with open(path, 'wb') as f:
+                f.write(raw)
+            return path
+        except Exception as e:
+            self.log_error(f"Error exporting local backup: {str(e)}")
+            return None
+    
     async def process(self, urls: List[str] = None) -> bool:
         """Main processing method - alias for update_master_sheet"""
         return await self.update_master_sheet()
@@ -203,9 +356,11 @@ class SheetsProcessor(BaseProcessor):
             self.log_step("Starting master sheet update")
             self.status = "processing"
             
-            # Get all videos and thumbnails from database
-            videos = await db_manager.get_all_videos()
-            thumbnails = await db_manager.get_all_thumbnails()
+            # Get all videos and thumbnails from database (independent reads, run together)
+            videos, thumbnails = await asyncio.gather(
+                db_manager.get_all_videos(),
+                db_manager.get_all_thumbnails()
+            )
             
             if not videos:
                 self.log_step("No videos found to update in master sheet")
@@ -242,17 +397,26 @@ class SheetsProcessor(BaseProcessor):
         try:
             content_list = []
             
+            # Index thumbnails by the base names they can match on, keeping the first one
+            thumbnails_by_base = {}
+            for thumbnail in thumbnails:
+                for name in (thumbnail.get('filename'), thumbnail.get('video_filename')):
+                    if name:
+                        thumbnails_by_base.setdefault(os.path.splitext(name)[0], thumbnail)
+            
             # Process videos
             for video in videos:
                 # Find matching thumbnail
                 video_filename = video.get('filename', '')
                 base_name = os.path.splitext(video_filename)[0]
-                matching_thumbnail = None
+                matching_thumbnail = thumbnails_by_base.get(base_name)
                 
-                for thumbnail in thumbnails:
-                    if base_name in thumbnail.get('filename', '') or base_name in thumbnail.get('video_filename', ''):
-                        matching_thumbnail = thumbnail
-                        break
+                if matching_thumbnail is None:
+                    # Fall back to a partial match, e.g. a thumbnail renamed with a "_1" suffix
+                    for thumbnail in thumbnails:
+                        if base_name in thumbnail.get('filename', '') or base_name in thumbnail.get('video_filename', ''):
+                            matching_thumbnail = thumbnail
+                            break
                 
                 # Prepare content info
                 content_info = {
@@ -302,12 +466,13 @@ class SheetsProcessor(BaseProcessor):
                 for content_info in content_list:
                     filename = content_info['filename']
                     self.local_data['rows'][filename] = content_info
-                self._save_local_backup()
+                self._save_local_backup(content_list)
                 return True
             
             # First, cleanup any existing duplicates
             self.log_step("Cleaning up duplicate entries in Google Sheets...")
             await self._cleanup_duplicates()
+            self._filename_row_index = await self._build_filename_index()
             
             # Update the sheet with new data
             self.log_step(f"Updating Google Sheet with {len(content_list)} entries")
@@ -326,9 +491,9 @@ class SheetsProcessor(BaseProcessor):
                 else:
                     new_entries.append(content_info)
             
-            # Update existing entries individually
-            for content_info in existing_entries:
-                await self._update_single_entry(content_info)
+            # Update existing entries in one batch; those missing from the sheet are added
+            if existing_entries:
+                new_entries.extend(await self._update_existing_entries(existing_entries))
             
             # Add new entries in batch
             if new_entries:
@@ -351,110 +516,197 @@ class SheetsProcessor(BaseProcessor):
                 self.log_step("Cannot cleanup duplicates - no Google Sheets service")
                 return
             
-            # Get all data from the sheet
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.master_sheet_id,
-                range=f'{self.master_sheet_name}!A1:S1000'
-            ).execute()
+            if (self._last_cleaned_generation == self._sheet_generation
+                    and time.monotonic() - self._last_cleaned_at < self.cleanup_interval):
+                self.log_step("No rows added since the last duplicate cleanup, skipping")
+                return
+            generation = self._sheet_generation
             
-            values = result.get('values', [])
+            # Get all data from the sheet
+            values = await self._get_sheet_values()
             if len(values) <= 1:  # Only headers or empty
                 self.log_step("No data to cleanup")
+                self._mark_cleaned(generation)
                 return
             
-            # Find duplicates by filename (column B)
-            seen_filenames = {}
-            rows_to_keep = [values[0]]  # Keep header row
+            # Find duplicates by filename (column B), keeping each filename's first row
+            seen_filenames = set()
             duplicates_found = []
             
             for idx, row in enumerate(values[1:], start=2):
-                if row and len(row) > 1:
+                if len(row) > 1:
                     filename = row[1]  # Column B is filename
                     if filename in seen_filenames:
                         duplicates_found.append(idx)
                         self.log_step(f"Found duplicate: {filename} at row {idx}")
                     else:
-                        seen_filenames[filename] = idx
-                        rows_to_keep.append(row)
+                        seen_filenames.add(filename)
             
             if not duplicates_found:
                 self.log_step("No duplicates found")
+                self._mark_cleaned(generation)
                 return
             
-            # Clear the sheet and write back only unique rows
-            self.service.spreadsheets().values().clear(
+            # Delete just the duplicate rows in one atomic batchUpdate, bottom-up so
+            # the indices of rows still to be deleted don't shift
+            sheet_gid = await self._get_sheet_gid()
+            requests = [{
+                'deleteDimension': {
+                    'range': {
+                        'sheetId': sheet_gid,
+                        'dimension': 'ROWS',
+                        'startIndex': idx - 1,
+                        'endIndex': idx
+                    }
+                }
+            } for idx in sorted(duplicates_found, reverse=True)]
+            
+            self._invalidate_sheet_cache()
+            self._filename_row_index = None
+            await self._execute(self.service.spreadsheets().batchUpdate(
                 spreadsheetId=self.master_sheet_id,
-                range=f'{self.master_sheet_name}!A1:S1000'
-            ).execute()
+                body={'requests': requests}
+            ))
             
-            # Write back unique rows
-            if rows_to_keep:
-                body = {'values': rows_to_keep}
-                self.service.spreadsheets().values().update(
-                    spreadsheetId=self.master_sheet_id,
-                    range=f'{self.master_sheet_name}!A1',
-                    valueInputOption='USER_ENTERED',
-                    body=body
-                ).execute()
-                
-                self.log_step(f"Cleaned up {len(duplicates_found)} duplicate entries")
-                self.log_step(f"Sheet now has {len(rows_to_keep)-1} unique entries")
+            self.log_step(f"Cleaned up {len(duplicates_found)} duplicate entries")
+            self.log_step(f"Sheet now has {len(seen_filenames)} unique entries")
+            self._mark_cleaned(generation)
             
         except Exception as e:
             self.log_error(f"Error cleaning up duplicates: {str(e)}")
     
+    def _mark_cleaned(self, generation: int) -> None:
+        """Record that the sheet had no duplicates as of the given generation"""
+        self._last_cleaned_generation = generation
+        self._last_cleaned_at = time.monotonic()
+    
+    async def _get_sheet_gid(self) -> int:
+        """Get the numeric sheetId of the master sheet tab, looked up once"""
+        if self._sheet_gid is None:
+            self._sheet_gid = self._find_sheet_gid(await self._get_sheet_info())
+        return self._sheet_gid
+    
+    async def _get_sheet_info(self, service=None) -> Dict[str, Any]:
+        """Get the spreadsheet's tab list, reusing a response fetched within sheet_info_ttl"""
+        cached = self._sheet_info_cache.get(self.master_sheet_id)
+        if cached and time.monotonic() - cached[0] < self.sheet_info_ttl:
+            return cached[1]
+        
+        sheet_info = await self._execute((service or self.service).spreadsheets().get(
+            spreadsheetId=self.master_sheet_id,
+            fields='sheets.properties(sheetId,title)'
+        ))
+        self._sheet_info_cache[self.master_sheet_id] = (time.monotonic(), sheet_info)
+        return sheet_info
+    
+    def _find_sheet_gid(self, sheet_info: Dict[str, Any]) -> int:
+        """Find the master sheet tab's sheetId in a spreadsheets().get response"""
+        for sheet in sheet_info.get('sheets', []):
+            if sheet['properties']['title'] == self.master_sheet_name:
+                return sheet['properties']['sheetId']
+        return 0
+    
     async def _update_single_entry(self, content_info: Dict[str, Any]):
         """Update a single entry in the sheet"""
+        await self._update_existing_entries([content_info])
+    
+    async def _update_existing_entries(self, existing_entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Update entries already in the sheet with one batchUpdate call
+        
+        Returns the entries that were not found in the sheet.
+        """
+        missing = []
         try:
-            filename = content_info['filename']
-            
             # Update local backup
-            self.local_data['rows'][filename] = content_info
-            self._save_local_backup()
+            for content_info in existing_entries:
+                self.local_data['rows'][content_info['filename']] = content_info
+            self._save_local_backup(existing_entries)
             
             if not self.service:
-                self.log_step(f"Saved update for {filename} to local backup")
-                return
-            
-            # Find the row number for this filename
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.master_sheet_id,
-                range=f'{self.master_sheet_name}!A1:B1000'
-            ).execute()
+                self.log_step(f"Saved updates for {len(existing_entries)} entries to local backup")
+                return missing
             
-            values = result.get('values', [])
-            row_number = None
-            
-            for idx, row in enumerate(values[1:], start=2):
-                if row and len(row) > 1 and row[1] == filename:
-                    row_number = idx
-                    break
+            # Find the row numbers from the index instead of searching per entry
+            row_index = self._filename_row_index
+            if row_index is None:
+                row_index = self._filename_row_index = await self._build_filename_index()
             
-            if not row_number:
-                self.log_step(f"Entry not found for {filename}, will add as new")
-                return
-            
-            # Prepare row data
-            row_data = []
-            for col in self.SHEET_COLUMNS:
-                value = content_info.get(col, '')
-                if col.startswith('upload_status_') and not value:
-                    value = self.STATUS_PENDING
-                row_data.append(value)
-            
-            # Update the row
-            range_name = f'{self.master_sheet_name}!A{row_number}:S{row_number}'
-            self.service.spreadsheets().values().update(
-                spreadsheetId=self.master_sheet_id,
-                range=range_name,
-                valueInputOption='USER_ENTERED',
-                body={'values': [row_data]}
-            ).execute()
+            data = []
+            for content_info in existing_entries:
+                filename = content_info['filename']
+                row_number = row_index.get(filename)
+                if not row_number:
+                    self.log_step(f"Entry not found for {filename}, will add as new")
+                    missing.append(content_info)
+                    continue
+                data.append({
+                    'range': f'{self.master_sheet_name}!A{row_number}:S{row_number}',
+                    'majorDimension': 'ROWS',
+                    'values': [self._build_row(content_info)]
+                })
+            
+            if not data:
+                return missing
+            
+            # Update the rows with as few requests as the payload limit allows
+            self._invalidate_sheet_cache()
+            for start in range(0, len(data), self.batch_update_size):
+                await self._execute(self.service.spreadsheets().values().batchUpdate(
+                    spreadsheetId=self.master_sheet_id,
+                    body={'valueInputOption': 'USER_ENTERED', 'data': data[start:start + self.batch_update_size]}
+                ))
             
-            self.log_step(f"Updated entry for {filename}")
+            self.log_step(f"Updated {len(data)} existing entries")
             
         except Exception as e:
-            self.log_error(f"Error updating single entry for {content_info.get('filename', 'unknown')}", e)
+            self.log_error("Error updating existing entries", e)
+        return missing
+    
+    async def _build_filename_index(self) -> Dict[str, int]:
+        """Map each filename in the sheet (column B) to its row number"""
+        row_index = {}
+        for idx, row in enumerate((await self._get_sheet_values())[1:], start=2):
+            if len(row) > 1:
+                row_index.setdefault(row[1], idx)
+        return row_index
+    
+    @retry_async(GOOGLE_API_RETRY_CONFIG, service_name="google_sheets")
+    async def _execute(self, request) -> Dict[str, Any]:
+        """Execute a Google API request in a worker thread so the event loop keeps running
+        
+        Rate limiting (429) and server errors are retried with jittered backoff,
+        waiting as long as the server's Retry-After asks; other 4xx fail at once.
+        """
+        return await asyncio.to_thread(request.execute)
+    
+    async def _get_sheet_values(self) -> List[List[Any]]:
+        """Get the sheet's rows, reusing a snapshot fetched within the last few seconds"""
+        if self._sheet_cache['values'] is not None and time.monotonic() < self._sheet_cache['expires_at']:
+            return self._sheet_cache['values']
+        
+        # An open-ended range returns just the used rows, however many there are;
+        # unformatted values skip the server's locale formatting
+        result = await self._execute(self.service.spreadsheets().values().get(
+            spreadsheetId=self.master_sheet_id,
+            range=f'{self.master_sheet_name}!A:S',
+            majorDimension='ROWS',
+            valueRenderOption='UNFORMATTED_VALUE'
+        ))
+        
+        values = result.get('values', [])
+        self._sheet_cache = {'values': values, 'expires_at': time.monotonic() + self.sheet_cache_ttl}
+        return values
+    
+    def _invalidate_sheet_cache(self) -> None:
+        """Drop the sheet snapshot so the next read fetches the sheet again"""
+        self._sheet_cache['expires_at'] = 0.0
+    
+    def _build_row(self, content_info: Dict[str, Any]) -> List[Any]:
+        """Build a sheet row in SHEET_COLUMNS order, defaulting upload statuses to pending
+        
+        content_info must have every column, as _prepare_sheet_data builds it.
+        """
+        return [value or default for value, default in zip(self._get_column_values(content_info), self._column_defaults)]
     
     async def _add_new_entries(self, new_entries: List[Dict[str, Any]]):
         """Add new entries to the sheet in batch"""
@@ -464,34 +716,27 @@ class SheetsProcessor(BaseProcessor):
                 return
             
             # Prepare batch data
-            batch_data = []
-            for content_info in new_entries:
-                row_data = []
-                for col in self.SHEET_COLUMNS:
-                    value = content_info.get(col, '')
-                    if col.startswith('upload_status_') and not value:
-                        value = self.STATUS_PENDING
-                    row_data.append(value)
-                batch_data.append(row_data)
+            batch_data = [self._build_row(content_info) for content_info in new_entries]
             
             # Get current sheet size to determine where to append
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.master_sheet_id,
-                range=f'{self.master_sheet_name}!A1:A1000'
-            ).execute()
-            
-            values = result.get('values', [])
+            values = await self._get_sheet_values()
             start_row = len(values) + 1
             
             # Append new entries
             range_name = f'{self.master_sheet_name}!A{start_row}'
             body = {'values': batch_data}
-            self.service.spreadsheets().values().update(
+            self._invalidate_sheet_cache()
+            await self._execute(self.service.spreadsheets().values().update(
                 spreadsheetId=self.master_sheet_id,
                 range=range_name,
                 valueInputOption='USER_ENTERED',
                 body=body
-            ).execute()
+            ))
+            
+            self._sheet_generation += 1
+            if self._filename_row_index is not None:
+                for row_number, content_info in enumerate(new_entries, start=start_row):
+                    self._filename_row_index.setdefault(content_info['filename'], row_number)
             
             self.log_step(f"Added {len(new_entries)} new entries to sheet")
             
@@ -501,26 +746,38 @@ class SheetsProcessor(BaseProcessor):
     async def _save_tracking_data_locally(self, content_list: List[Dict]) -> None:
         """Save tracking data locally as backup"""
         try:
-            # Create directory if it doesn't exist
             local_dir = 'assets/downloads/socialmedia/tracking'
-            os.makedirs(local_dir, exist_ok=True)
-            
-            # Save as JSON
-            json_file = os.path.join(local_dir, 'tracking_data.json')
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(content_list, f, indent=2, ensure_ascii=False)
             
-            # Save as CSV
-            csv_file = os.path.join(local_dir, 'tracking_data.csv')
-            if content_list:
-                df = pd.DataFrame(content_list)
-                df.to_csv(csv_file, index=False, encoding='utf-8')
+            # Serializing and writing the files is blocking, keep it off the event loop
+            await asyncio.to_thread(self._write_tracking_files, local_dir, content_list)
             
             self.log_step(f"Tracking data saved locally to {local_dir}")
             
         except Exception as e:
             self.log_error("Error saving tracking data locally", e)
     
+    def _write_tracking_files(self, local_dir: str, content_list: List[Dict]) -> None:
+        """Write tracking data as JSON and CSV, replacing each file atomically"""
+        # Create directory if it doesn't exist
+        os.makedirs(local_dir, exist_ok=True)
+        
+        # Save as JSON
+        json_file = os.path.join(local_dir, 'tracking_data.json')
+        raw = (orjson.dumps(content_list, option=orjson.OPT_INDENT_2) if orjson
+               else json.dumps(content_list, indent=2, ensure_ascii=False).encode('utf-8'))
+        with open(f"{json_file}.tmp", 'wb') as f:
+            f.write(raw)
+        os.replace(f"{json_file}.tmp", json_file)
+        
+        # Save as CSV
+        csv_file = os.path.join(local_dir, 'tracking_data.csv')
+        if content_list:
+            with open(f"{csv_file}.tmp", 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=self.SHEET_COLUMNS, extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(content_list)
+            os.replace(f"{csv_file}.tmp", csv_file)
+    
     async def _upload_thumbnail_images(self, content_list: List[Dict]) -> None:
         """Upload thumbnail images to Google Drive and update content_list with image URLs"""
         try:
@@ -529,57 +786,111 @@ class SheetsProcessor(BaseProcessor):
                 return
             
             # Get Drive service for image uploads
-            from googleapiclient.discovery import build
-            from googleapiclient.http import MediaFileUpload
-            
-            drive_service = build('drive', 'v3', credentials=self.service._http.credentials)
+            drive_service = self._get_drive_service()
             
             # Get existing thumbnail images from Google Drive to avoid duplicates
             existing_images = await self._get_existing_thumbnail_images(drive_service)
             
-            for content_info in content_list:
-                thumbnail_name = content_info.get('thumbnail_name', '')
-                if not thumbnail_name:
-                    continue
-                
-                # Check if thumbnail image already exists in Google Drive
-                image_filename = f"thumbnail_{thumbnail_name}"
-                if image_filename in existing_images:
-                    content_info['thumbnail_image'] = existing_images[image_filename]
-                    self.log_step(f"Thumbnail image already exists in Drive for {content_info.get('filename', '')}. Skipping upload.")
-                    continue
-                
-                # Find the thumbnail file locally
-                thumbnail_path = await self._find_thumbnail_file(thumbnail_name)
-                if not thumbnail_path:
-                    self.log_step(f"Thumbnail file not found locally: {thumbnail_name}")
-                    continue
-                
-                # Upload image to Drive
-                image_url = await self._upload_thumbnail_to_drive(drive_service, thumbnail_path, thumbnail_name)
-                if image_url:
-                    content_info['thumbnail_image'] = image_url
-                    self.log_step(f"Uploaded thumbnail image for {content_info.get('filename', '')}")
+            # Index the local thumbnail files with one directory walk, if any need uploading
+            pending = [
+                content_info for content_info in content_list
+                if content_info.get('thumbnail_name')
+                and f"thumbnail_{content_info['thumbnail_name']}" not in existing_images
+            ]
+            thumbnail_files = await asyncio.to_thread(self._index_thumbnail_files) if pending else {}
+            
+            # Uploads are independent, so run them concurrently (bounded by the semaphore)
+            with_thumbnails = [content_info for content_info in content_list if content_info.get('thumbnail_name')]
+            results = await asyncio.gather(
+                *[self._upload_content_thumbnail(drive_service, content_info, existing_images, thumbnail_files)
+                  for content_info in with_thumbnails],
+                return_exceptions=True
+            )
+            
+            uploaded = []
+            for content_info, result in zip(with_thumbnails, results):
+                if isinstance(result, Exception):
+                    self.log_error(f"Error uploading thumbnail image: {str(result)}")
+                elif result:
+                    uploaded.append((content_info, result))
+            
+            if not uploaded:
+                return
+            
+            # Make the new images publicly accessible, all in batched requests
+            shared = await self._share_thumbnail_images(drive_service, [image_id for _, image_id in uploaded])
+            for content_info, image_id in uploaded:
+                if image_id in shared:
+                    # Image URL for use in IMAGE formula
+                    image_url = f"https://drive.google.com/uc?export=view&id={image_id}"
                 else:
-                    self.log_error(f"Failed to upload thumbnail image for {content_info.get('filename', '')}")
+                    # Fallback to original URL format
+                    image_url = f"https://drive.google.com/uc?id={image_id}"
+                content_info['thumbnail_image'] = image_url
+                existing_images[f"thumbnail_{content_info['thumbnail_name']}"] = image_url
+                self.log_step(f"Uploaded thumbnail image for {content_info.get('filename', '')}")
                     
         except Exception as e:
             self.log_error(f"Error uploading thumbnail images: {str(e)}")
     
+    def _get_drive_service(self) -> Any:
+        """Get the Drive service, built once with the Sheets service's credentials"""
+        if self._drive_service is None:
+            creds = self.service._http.credentials
+            
+            # httplib2 is not thread-safe, so every request gets its own transport;
+            # this lets uploads run concurrently in worker threads
+            def build_request(http, *args, **kwargs):
+                return HttpRequest(google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http()), *args, **kwargs)
+            
+            self._drive_service = build('drive', 'v3', credentials=creds, requestBuilder=build_request,
+                                        cache_discovery=False)
+        return self._drive_service
+    
+    async def _upload_content_thumbnail(self, drive_service, content_info: Dict, existing_images: Dict[str, str],
+                                        thumbnail_files: Dict[str, str]) -> Optional[str]:
+        """Upload one entry's thumbnail image unless Drive already has it, returning a new image's ID"""
+        thumbnail_name = content_info['thumbnail_name']
+        
+        # Check if thumbnail image already exists in Google Drive
+        image_filename = f"thumbnail_{thumbnail_name}"
+        if image_filename in existing_images:
+            content_info['thumbnail_image'] = existing_images[image_filename]
+            self.log_step(f"Thumbnail image already exists in Drive for {content_info.get('filename', '')}. Skipping upload.")
+            return None
+        
+        # Find the thumbnail file locally
+        thumbnail_path = thumbnail_files.get(thumbnail_name)
+        if not thumbnail_path:
+            self.log_step(f"Thumbnail file not found locally: {thumbnail_name}")
+            return None
+        
+        # Upload image to Drive
+        async with self._thumbnail_semaphore:
+            image_id = await self._upload_thumbnail_to_drive(drive_service, thumbnail_path, thumbnail_name)
+        if not image_id:
+            self.log_error(f"Failed to upload thumbnail image for {content_info.get('filename', '')}")
+        return image_id
+    
     async def _find_thumbnail_file(self, thumbnail_name: str) -> Optional[str]:
         """Find thumbnail file in the thumbnails directory"""
+        return (await asyncio.to_thread(self._index_thumbnail_files)).get(thumbnail_name)
+    
+    def _index_thumbnail_files(self) -> Dict[str, str]:
+        """Map each file name under the thumbnails directory to its path, walking it once"""
+        thumbnail_files = {}
         try:
             thumbnails_dir = "assets/downloads/thumbnails"
             for root, dirs, files in os.walk(thumbnails_dir):
-                if thumbnail_name in files:
-                    return os.path.join(root, thumbnail_name)
-            return None
+                for name in files:
+                    # Keep the first match in walk order, as the per-file search did
+                    thumbnail_files.setdefault(name, os.path.join(root, name))
         except Exception as e:
-            self.log_error(f"Error finding thumbnail file {thumbnail_name}: {str(e)}")
-            return None
+            self.log_error(f"Error indexing thumbnail files: {str(e)}")
+        return thumbnail_files
     
     async def _upload_thumbnail_to_drive(self, drive_service, thumbnail_path: str, thumbnail_name: str) -> Optional[str]:
-        """Upload thumbnail to Google Drive and return the image URL"""
+        """Upload thumbnail to Google Drive and return the image's file ID"""
         try:
             # Upload image to Drive first
             file_metadata = {
@@ -587,54 +898,77 @@ class SheetsProcessor(BaseProcessor):
                 'parents': ['1iUmCVkX863MqyvJIZ_aWbi9toEI39X8Z']  # Thumbnails folder
             }
             
+            # Drive calls block, so they run in worker threads
             media = MediaFileUpload(thumbnail_path, mimetype='image/jpeg')
-            file = drive_service.files().create(
+            file = await self._execute(drive_service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields='id'
-            ).execute()
-            
-            image_id = file.get('id')
-            if not image_id:
-                return None
+            ))
             
-            # Make the image publicly accessible
-            try:
-                drive_service.permissions().create(
-                    fileId=image_id,
-                    body={'role': 'reader', 'type': 'anyone'}
-                ).execute()
-                
-                # Return the image URL for use in IMAGE formula
-                return f"https://drive.google.com/uc?export=view&id={image_id}"
-                
-            except Exception as permission_error:
-                self.log_error(f"Error setting image permissions: {str(permission_error)}")
-                # Fallback to original URL format
-                return f"https://drive.google.com/uc?id={image_id}"
+            return file.get('id')
                 
         except Exception as e:
             self.log_error(f"Error uploading thumbnail to Drive: {str(e)}")
             return None
     
+    async def _share_thumbnail_images(self, drive_service, image_ids: List[str]) -> set:
+        """Make images publicly readable with batched requests, returning the IDs that succeeded"""
+        shared = set()
+        
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                self.log_error(f"Error setting image permissions: {str(exception)}")
+            else:
+                shared.add(request_id)
+        
+        # A Drive batch request holds at most 100 calls
+        for start in range(0, len(image_ids), 100):
+            batch = drive_service.new_batch_http_request(callback=on_response)
+            for image_id in image_ids[start:start + 100]:
+                batch.add(
+                    drive_service.permissions().create(fileId=image_id, body={'role': 'reader', 'type': 'anyone'}),
+                    request_id=image_id
+                )
+            try:
+                await self._execute(batch)
+            except Exception as e:
+                self.log_error(f"Error setting image permissions: {str(e)}")
+        
+        return shared
+    
     async def _get_existing_thumbnail_images(self, drive_service) -> Dict[str, str]:
         """Get existing thumbnail images from Google Drive to avoid duplicates"""
+        if self._drive_thumb_cache is not None and time.monotonic() - self._drive_thumb_cache_at < self.drive_thumb_cache_ttl:
+            return self._drive_thumb_cache
+        
         try:
-            # Search for files in the thumbnails folder
-            results = drive_service.files().list(
-                q="'1iUmCVkX863MqyvJIZ_aWbi9toEI39X8Z' in parents and name contains 'thumbnail_'",
-                fields="files(id, name, webViewLink)"
-            ).execute()
-            
+            # Search for files in the thumbnails folder, following every page
+            # (a single list call stops at the first 100 files)
             existing_images = {}
-            for file_info in results.get('files', []):
-                filename = file_info.get('name', '')
-                file_id = file_info.get('id', '')
-                if filename and file_id:
-                    # Create the image URL for use in IMAGE formula
-                    image_url = f"https://drive.google.com/uc?export=view&id={file_id}"
-                    existing_images[filename] = image_url
+            page_token = None
+            while True:
+                results = await self._execute(drive_service.files().list(
+                    q="'1iUmCVkX863MqyvJIZ_aWbi9toEI39X8Z' in parents and name contains 'thumbnail_'",
+                    fields="nextPageToken, files(id, name)",
+                    pageSize=1000,
+                    pageToken=page_token
+                ))
+                
+                for file_info in results.get('files', []):
+                    filename = file_info.get('name', '')
+                    file_id = file_info.get('id', '')
+                    if filename and file_id:
+                        # Create the image URL for use in IMAGE formula
+                        image_url = f"https://drive.google.com/uc?export=view&id={file_id}"
+                        existing_images[filename] = image_url
+                
+                page_token = results.get('nextPageToken')
+                if not page_token:
+                    break
             
+            self._drive_thumb_cache = existing_images
+            self._drive_thumb_cache_at = time.monotonic()
             self.log_step(f"Found {len(existing_images)} existing thumbnail images in Google Drive")
             return existing_images
             
@@ -651,7 +985,7 @@ class SheetsProcessor(BaseProcessor):
             
             # Try to get the existing sheet
             try:
-                sheet_info = self.service.spreadsheets().get(spreadsheetId=self.master_sheet_id).execute()
+                sheet_info = await self._get_sheet_info()
                 self.log_step("Found existing master tracking sheet")
                 
                 # Check if our target sheet exists
@@ -662,6 +996,7 @@ class SheetsProcessor(BaseProcessor):
                     if sheet_names:
                         self.master_sheet_name = sheet_names[0]
                         self.log_step(f"Using first available sheet: {self.master_sheet_name}")
+                self._sheet_gid = self._find_sheet_gid(sheet_info)
                 
                 # Ensure headers exist
                 await self._ensure_headers_exist()
@@ -694,11 +1029,13 @@ class SheetsProcessor(BaseProcessor):
                 }]
             }
             
-            created_sheet = self.service.spreadsheets().create(body=spreadsheet).execute()
+            created_sheet = await self._execute(self.service.spreadsheets().create(body=spreadsheet))
             new_sheet_id = created_sheet['spreadsheetId']
+            self._sheet_gid = self._find_sheet_gid(created_sheet)
             
             # Update the master_sheet_id in settings
             self.master_sheet_id = new_sheet_id
+            self._headers_verified = False
             self.log_step(f"Created new master tracking sheet with ID: {new_sheet_id}")
             
             # Initialize the sheet with headers
@@ -711,33 +1048,34 @@ class SheetsProcessor(BaseProcessor):
     async def _ensure_headers_exist(self) -> None:
         """Ensure headers exist in the sheet"""
         try:
-            if not self.service:
+            if not self.service or self._headers_verified:
                 return
             
             # Check if first row has headers
-            result = self.service.spreadsheets().values().get(
+            result = await self._execute(self.service.spreadsheets().values().get(
                 spreadsheetId=self.master_sheet_id,
-                range=f'{self.master_sheet_name}!A1:S1'
-            ).execute()
+                range=f'{self.master_sheet_name}!A1:{self._header_last_column}1'
+            ))
             
             values = result.get('values', [])
             if not values or len(values[0]) < len(self.SHEET_COLUMNS):
                 self.log_step("Adding headers to sheet")
-                # Add headers
-                header_values = [self.SHEET_COLUMNS]
-                body = {'values': header_values}
-                self.service.spreadsheets().values().update(
-                    spreadsheetId=self.master_sheet_id,
-                    range=f'{self.master_sheet_name}!A1',
-                    valueInputOption='RAW',
-                    body=body
-                ).execute()
+                self._invalidate_sheet_cache()
+                sheet_gid = await self._get_sheet_gid()
                 
-                # Apply formatting to header row
+                # Write the headers and format the header row in one batchUpdate
                 requests = [{
+                    'updateCells': {
+                        'start': {'sheetId': sheet_gid, 'rowIndex': 0, 'columnIndex': 0},
+                        'rows': [{
+                            'values': [{'userEnteredValue': {'stringValue': col}} for col in self.SHEET_COLUMNS]
+                        }],
+                        'fields': 'userEnteredValue'
+                    }
+                }, {
                     'repeatCell': {
                         'range': {
-                            'sheetId': 0,
+                            'sheetId': sheet_gid,
                             'startRowIndex': 0,
                             'endRowIndex': 1
                         },
@@ -756,13 +1094,14 @@ class SheetsProcessor(BaseProcessor):
                         'fields': 'userEnteredFormat(backgroundColor,textFormat)'
                     }
                 }]
-                self.service.spreadsheets().batchUpdate(
+                await self._execute(self.service.spreadsheets().batchUpdate(
                     spreadsheetId=self.master_sheet_id,
                     body={'requests': requests}
-                ).execute()
+                ))
                 self.log_step("Headers added and formatted successfully")
             else:
                 self.log_step("Headers already exist in sheet")
+            self._headers_verified = True
                 
         except Exception as e:
             self.log_error(f"Error ensuring headers exist: {str(e)}")
@@ -771,6 +1110,10 @@ class SheetsProcessor(BaseProcessor):
         """Cleanup sheets processor resources"""
         try:
             self.log_step("Cleaning up sheets processor")
+            await self._stop_backup_flusher()
+            if self._backup_conn is not None:
+                self._backup_conn.close()
+                self._backup_conn = None
             self.status = "idle"
             self.log_step("Sheets processor cleanup completed")
         except Exception as e:
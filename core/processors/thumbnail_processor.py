@@ -14,6 +14,7 @@ from pathlib import Path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from core.processors.base_processor import BaseProcessor
+from system.config import settings
 from system.database import db_manager
 
 
@@ -61,17 +62,31 @@ class ThumbnailProcessor(BaseProcessor):
             
             self.log_step(f"Found {len(thumbnails)} thumbnails to process")
             
-            # Process each thumbnail
-            for thumbnail in thumbnails:
-                try:
-                    success = await self._process_single_thumbnail(thumbnail)
-                    if success:
-                        self.processed_count += 1
-                    else:
-                        self.failed_count += 1
-                except Exception as e:
-                    self.log_error(f"Error processing thumbnail {thumbnail.get('filename', 'unknown')}", e)
+            # Process thumbnails concurrently, bounded by the configured limit
+            semaphore = asyncio.Semaphore(settings.max_concurrent_thumbnails)
+            
+            async def process_with_semaphore(thumbnail: Dict[str, Any]) -> bool:
+                async with semaphore:
+                    return await self._process_single_thumbnail(thumbnail)
+            
+            results = await asyncio.gather(
+                *[process_with_semaphore(thumbnail) for thumbnail in thumbnails],
+                return_exceptions=True
+            )
+            
+            processed_ids = []
+            for thumbnail, result in zip(thumbnails, results):
+                if isinstance(result, Exception):
+                    self.log_error(f"Error processing thumbnail {thumbnail.get('filename', 'unknown')}", result)
                     self.failed_count += 1
+                elif result:
+                    processed_ids.append(thumbnail['id'])
+                    self.processed_count += 1
+                else:
+                    self.failed_count += 1
+            
+            # Record every processed thumbnail in a single transaction
+            await db_manager.bulk_update_thumbnail_status(processed_ids, 'PROCESSED')
             
             self.status = "completed"
             self.log_step(f"Thumbnail processing completed: {self.processed_count} successful, {self.failed_count} failed")
@@ -83,7 +98,7 @@ class ThumbnailProcessor(BaseProcessor):
             return False
     
     async def _process_single_thumbnail(self, thumbnail: Dict[str, Any]) -> bool:
-        """Process a single thumbnail"""
+        """Process a single thumbnail; the caller records its status in the database"""
         try:
             filename = thumbnail.get('filename', '')
             file_path = thumbnail.get('file_path', '')
@@ -98,9 +113,6 @@ class ThumbnailProcessor(BaseProcessor):
             # For now, we'll simulate the processing
             await asyncio.sleep(0.2)  # Simulate processing time
             
-            # Update database with processing status
-            await db_manager.update_thumbnail_status(thumbnail['id'], 'PROCESSED')
-            
             self.log_step(f"Successfully processed thumbnail: {filename}")
             return True
             
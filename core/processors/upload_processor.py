@@ -26,7 +26,9 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import HttpRequest, MediaFileUpload
+import google_auth_httplib2
+import httplib2
 from tqdm import tqdm
 
 
@@ -65,6 +67,9 @@ class UploadProcessor(BaseProcessor):
         # Drive service cache
         self._drive_service = None
         self._drive_folder_id = None
+        
+        # File hashes keyed by (device, inode, size, mtime) so renames and repeat runs don't rehash
+        self._hash_cache: Dict[tuple, str] = {}
     
     async def initialize(self) -> bool:
         """Initialize upload processor"""
@@ -108,7 +113,12 @@ class UploadProcessor(BaseProcessor):
                 with open(self.token_file, 'w') as token:
                     token.write(creds.to_json())
             
-            return build('drive', 'v3', credentials=creds)
+            # httplib2 is not thread-safe, so every request gets its own transport;
+            # this lets uploads run concurrently in worker threads
+            def build_request(http, *args, **kwargs):
+                return HttpRequest(google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http()), *args, **kwargs)
+            
+            return build('drive', 'v3', credentials=creds, requestBuilder=build_request)
         except Exception as e:
             self.log_error(f"Failed to get Drive service: {str(e)}")
             return None
@@ -145,11 +155,32 @@ class UploadProcessor(BaseProcessor):
     
     def _get_file_hash(self, file_path: str) -> str:
         """Calculate SHA256 hash of file content"""
+        file_stat = os.stat(file_path)
+        cache_key = (file_stat.st_dev, file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+        cached_hash = self._hash_cache.get(cache_key)
+        if cached_hash:
+            return cached_hash
+        
         sha256_hash = hashlib.sha256()
         with open(file_path, "rb") as f:
             for byte_block in iter(lambda: f.read(4096), b""):
                 sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        self._hash_cache[cache_key] = sha256_hash.hexdigest()
+        return self._hash_cache[cache_key]
+    
+    def _get_uploaded_paths(self, state: Dict[str, Dict]) -> set:
+        """Normalized paths that are recorded as uploaded to Drive"""
+        return {
+            path for path, file_data in state.items()
+            if file_data.get('upload_status') == 'COMPLETED' and file_data.get('drive_id')
+        }
+    
+    def _is_uploaded_unchanged(self, state: Dict[str, Dict], normalized_path: str, current_hash: str) -> bool:
+        """Whether the file was already uploaded with the same content"""
+        file_data = state.get(normalized_path)
+        return bool(file_data and
+                    file_data.get('file_hash') == current_hash and
+                    file_data.get('upload_status') == 'COMPLETED')
     
     def _get_file_by_name(self, service, filename: str, folder_id: str) -> Optional[Dict]:
         """Find a file by name in a specific folder"""
@@ -168,33 +199,38 @@ class UploadProcessor(BaseProcessor):
             return None
     
     async def _upload_video_file(self, service, file_path: str, state: Dict) -> Optional[str]:
-        """Upload video file with progress tracking"""
+        """Upload video file with progress tracking
+        
+        Blocking Drive and hashing calls run in worker threads so several videos
+        can upload at once.
+        """
         try:
             filename = os.path.basename(file_path)
-            folder_id = self._get_drive_folder_id(service, self.drive_folder)
+            folder_id = self._drive_folder_id or await asyncio.to_thread(self._get_drive_folder_id, service, self.drive_folder)
             if not folder_id:
                 return None
             
-            current_hash = self._get_file_hash(file_path)
+            current_hash = await asyncio.to_thread(self._get_file_hash, file_path)
             normalized_path = os.path.normpath(file_path)
             
             # Check if file exists in Drive first
-            existing_file = self._get_file_by_name(service, filename, folder_id)
+            existing_file = await asyncio.to_thread(self._get_file_by_name, service, filename, folder_id)
             
             if existing_file:
                 # File exists in Drive, check if we should skip or update
-                if (normalized_path in state and 
-                    state[normalized_path].get('file_hash') == current_hash and 
-                    state[normalized_path].get('upload_status') == 'COMPLETED'):
+                if self._is_uploaded_unchanged(state, normalized_path, current_hash):
                     self.log_step(f"Video {filename} already uploaded with same content. Skipping.")
                     return state[normalized_path].get('drive_id')
                 else:
                     self.log_step(f"Updating existing video in Drive: {filename}")
-                    file_id = self._update_existing_file(service, existing_file['id'], file_path)
+                    file_id = await asyncio.to_thread(self._update_existing_file, service, existing_file['id'], file_path)
             else:
                 # File doesn't exist in Drive, upload new
                 self.log_step(f"Uploading new video to Drive: {filename}")
-                file_id = self._upload_new_file(service, file_path, filename, folder_id)
+                file_id = await asyncio.to_thread(self._upload_new_file, service, file_path, filename, folder_id)
+            
+            if not file_id:
+                return None
             
             # Update state
             state[normalized_path] = {
@@ -227,6 +263,21 @@ class UploadProcessor(BaseProcessor):
             self.log_error(f"Error uploading video {file_path}: {str(e)}")
             return None
     
+    def _upload_new_file(self, service, file_path: str, filename: str, folder_id: str) -> Optional[str]:
+        """Upload a new file into a Drive folder"""
+        try:
+            media = MediaFileUpload(file_path, resumable=True)
+            file = service.files().create(
+                body={'name': filename, 'parents': [folder_id]},
+                media_body=media,
+                fields='id, name'
+            ).execute()
+            self.log_step(f"Uploaded new file: {file.get('name')} (ID: {file.get('id')})")
+            return file.get('id')
+        except Exception as e:
+            self.log_error(f"Error uploading file {filename}: {str(e)}")
+            return None
+    
     def _update_existing_file(self, service, file_id: str, file_path: str) -> Optional[str]:
         """Update existing file in Drive"""
         try:
@@ -249,9 +300,7 @@ class UploadProcessor(BaseProcessor):
             normalized_path = os.path.normpath(file_path)
             
             # Check if already uploaded with same content
-            if (normalized_path in state and 
-                state[normalized_path].get('file_hash') == current_hash and 
-                state[normalized_path].get('upload_status') == 'COMPLETED'):
+            if self._is_uploaded_unchanged(state, normalized_path, current_hash):
                 self.log_step(f"Thumbnail {filename} already uploaded with same content. Skipping.")
                 return state[normalized_path].get('drive_id')
             
@@ -298,28 +347,38 @@ class UploadProcessor(BaseProcessor):
             self.log_error(f"Error uploading thumbnail {file_path}: {str(e)}")
             return None
     
-    def _find_mp4_files(self, folder: str) -> List[str]:
+    def _scan_files(self, folder: str, extensions: set, skip_paths: set = None, prune_excluded: bool = False) -> List[str]:
+        """Walk folder with os.scandir and collect files with the given extensions
+        
+        Normalized paths in skip_paths are dropped during the walk, so files that
+        are already uploaded never cost more than the directory listing itself.
+        """
+        skip_paths = skip_paths or set()
+        found = []
+        pending_dirs = [folder]
+        while pending_dirs:
+            try:
+                with os.scandir(pending_dirs.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if prune_excluded and any(excluded in entry.name.lower() for excluded in self.excluded_folders):
+                                continue
+                            pending_dirs.append(entry.path)
+                        elif (os.path.splitext(entry.name)[1].lower() in extensions and
+                              os.path.normpath(entry.path) not in skip_paths):
+                            found.append(entry.path)
+            except OSError:
+                # Missing or unreadable directories are skipped, as os.walk does
+                continue
+        return found
+    
+    def _find_mp4_files(self, folder: str, skip_paths: set = None) -> List[str]:
         """Find all MP4 files in folder and subfolders"""
-        mp4_files = []
-        for root, dirs, files in os.walk(folder):
-            # Filter out excluded directories
-            dirs[:] = [d for d in dirs if not any(excluded in d.lower() for excluded in self.excluded_folders)]
-            for file in files:
-                if file.lower().endswith('.mp4'):
-                    mp4_files.append(os.path.join(root, file))
-        return mp4_files
+        return self._scan_files(folder, {'.mp4'}, skip_paths, prune_excluded=True)
     
-    def _find_image_files(self, folder: str) -> List[str]:
+    def _find_image_files(self, folder: str, skip_paths: set = None) -> List[str]:
         """Find all image files in folder"""
-        files = []
-        if not os.path.exists(folder):
-            return files
-        for root, dirs, filenames in os.walk(folder):
-            for name in filenames:
-                ext = os.path.splitext(name)[1].lower()
-                if ext in self.image_extensions:
-                    files.append(os.path.join(root, name))
-        return files
+        return self._scan_files(folder, self.image_extensions, skip_paths)
     
     async def process_transcripts(self) -> bool:
         """Process transcript file uploads to Google Drive"""
@@ -474,20 +533,8 @@ class UploadProcessor(BaseProcessor):
             # Load state from database
             state = await self._load_video_state()
             
-            # Find MP4 files to upload
-            all_files = self._find_mp4_files(self.video_folder)
-            
-            # Filter out already uploaded files
-            files_to_upload = []
-            for file_path in all_files:
-                normalized_path = os.path.normpath(file_path)
-                if normalized_path in state:
-                    video_data = state[normalized_path]
-                    if (video_data.get('upload_status') == 'COMPLETED' and 
-                        video_data.get('drive_id')):
-                        self.log_step(f"Video {os.path.basename(file_path)} already uploaded. Skipping.")
-                        continue
-                files_to_upload.append(file_path)
+            # Find MP4 files to upload, skipping already uploaded files during the scan
+            files_to_upload = self._find_mp4_files(self.video_folder, self._get_uploaded_paths(state))
             
             if not files_to_upload:
                 self.log_step("No new videos to upload")
@@ -495,16 +542,29 @@ class UploadProcessor(BaseProcessor):
             
             self.log_step(f"Found {len(files_to_upload)} new videos to upload")
             
-            # Upload each file
-            for file_path in files_to_upload:
-                try:
-                    file_id = await self._upload_video_file(self._drive_service, file_path, state)
-                    if file_id:
-                        self.uploaded_count += 1
-                    else:
-                        self.failed_count += 1
-                except Exception as e:
-                    self.log_error(f"Error uploading video {file_path}", e)
+            # Resolve the target folder once so concurrent uploads don't race to create it
+            if not self._drive_folder_id:
+                self._drive_folder_id = await asyncio.to_thread(self._get_drive_folder_id, self._drive_service, self.drive_folder)
+            
+            # Upload files concurrently, bounded by the configured upload limit
+            semaphore = asyncio.Semaphore(settings.max_concurrent_uploads)
+            
+            async def upload_with_semaphore(file_path: str) -> Optional[str]:
+                async with semaphore:
+                    return await self._upload_video_file(self._drive_service, file_path, state)
+            
+            results = await asyncio.gather(
+                *[upload_with_semaphore(file_path) for file_path in files_to_upload],
+                return_exceptions=True
+            )
+            
+            for file_path, result in zip(files_to_upload, results):
+                if isinstance(result, Exception):
+                    self.log_error(f"Error uploading video {file_path}", result)
+                    self.failed_count += 1
+                elif result:
+                    self.uploaded_count += 1
+                else:
                     self.failed_count += 1
             
             # Save state to database
@@ -528,20 +588,8 @@ class UploadProcessor(BaseProcessor):
             # Load state from database
             state = await self._load_thumbnail_state()
             
-            # Find image files to upload
-            all_files = self._find_image_files(self.thumbnails_folder)
-            
-            # Filter out already uploaded files
-            files_to_upload = []
-            for file_path in all_files:
-                normalized_path = os.path.normpath(file_path)
-                if normalized_path in state:
-                    thumbnail_data = state[normalized_path]
-                    if (thumbnail_data.get('upload_status') == 'COMPLETED' and 
-                        thumbnail_data.get('drive_id')):
-                        self.log_step(f"Thumbnail {os.path.basename(file_path)} already uploaded. Skipping.")
-                        continue
-                files_to_upload.append(file_path)
+            # Find image files to upload, skipping already uploaded files during the scan
+            files_to_upload = self._find_image_files(self.thumbnails_folder, self._get_uploaded_paths(state))
             
             if not files_to_upload:
                 self.log_step("No new thumbnails to upload")
@@ -600,19 +648,17 @@ class UploadProcessor(BaseProcessor):
     async def _save_video_state(self, state: Dict[str, Dict]):
         """Save video state to database"""
         try:
-            for file_path, video_data in state.items():
-                await db_manager.upsert_video({
+            await db_manager.upsert_video_upload_states([
+                {
                     'filename': video_data.get('filename', ''),
                     'file_path': file_path,
                     'drive_id': video_data.get('drive_id', ''),
                     'drive_url': video_data.get('drive_url', ''),
                     'upload_status': video_data.get('upload_status', 'PENDING'),
-                    'file_hash': video_data.get('file_hash', ''),
-                    'url': video_data.get('url', ''),
-                    'transcription_status': video_data.get('transcription_status', 'PENDING'),
-                    'transcription_text': video_data.get('transcription_text', ''),
-                    'smart_name': video_data.get('smart_name', '')
-                })
+                    'file_hash': video_data.get('file_hash', '')
+                }
+                for file_path, video_data in state.items()
+            ])
             self.log_step(f"Video state saved to database: {len(state)} files tracked")
         except Exception as e:
             self.log_error(f"Error saving video state: {str(e)}")
@@ -644,8 +690,8 @@ class UploadProcessor(BaseProcessor):
     async def _save_thumbnail_state(self, state: Dict[str, Dict]):
         """Save thumbnail state to database"""
         try:
-            for file_path, thumbnail_data in state.items():
-                await db_manager.upsert_thumbnail({
+            await db_manager.upsert_thumbnail_upload_states([
+                {
                     'filename': thumbnail_data.get('filename', ''),
                     'file_path': file_path,
                     'video_filename': thumbnail_data.get('video_filename', ''),
@@ -653,7 +699,9 @@ class UploadProcessor(BaseProcessor):
                     'drive_url': thumbnail_data.get('drive_url', ''),
                     'upload_status': thumbnail_data.get('upload_status', 'PENDING'),
                     'file_hash': thumbnail_data.get('file_hash', '')
-                })
+                }
+                for file_path, thumbnail_data in state.items()
+            ])
             self.log_step(f"Thumbnail state saved to database: {len(state)} files tracked")
         except Exception as e:
             self.log_error(f"Error saving thumbnail state: {str(e)}")
@@ -11,6 +11,7 @@ import sys
 import re
 import time
 import json
+import functools
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 from pathlib import Path
@@ -35,6 +36,36 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+
+@functools.lru_cache(maxsize=4096)
+def _video_id_from_url(url: str) -> Optional[str]:
+    """Extract video ID from various platform URLs"""
+    try:
+        # YouTube
+        if 'youtube.com' in url or 'youtu.be' in url:
+            if 'youtu.be/' in url:
+                return url.split('youtu.be/')[-1].split('?')[0]
+            elif 'v=' in url:
+                return url.split('v=')[-1].split('&')[0]
+        
+        # Instagram
+        elif 'instagram.com' in url:
+            if '/p/' in url:
+                return url.split('/p/')[-1].split('/')[0]
+            elif '/reel/' in url:
+                return url.split('/reel/')[-1].split('/')[0]
+        
+        # TikTok
+        elif 'tiktok.com' in url:
+            if '/video/' in url:
+                return url.split('/video/')[-1].split('?')[0]
+        
+        # Generic fallback - use last part of URL
+        return url.split('/')[-1].split('?')[0]
+    except Exception:
+        return None
+
+
 class VideoProcessor(BaseProcessor):
     """Handles video processing and transcription with real logic"""
     
@@ -55,6 +86,9 @@ class VideoProcessor(BaseProcessor):
         self.chunk_duration = int(os.getenv("CHUNK_DURATION", "30"))
         self.keep_audio_files = os.getenv("KEEP_AUDIO_FILES", "true").lower() == "true"
         
+        # Existing video records keyed by video ID, loaded once per batch
+        self._video_records: Optional[Dict[str, Dict]] = None
+        
         # OpenAI client
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
@@ -99,20 +133,27 @@ class VideoProcessor(BaseProcessor):
             self.log_step(f"Processing {len(urls)} URLs")
             self.status = "processing"
             
-            # Load existing transcription state
-            transcription_state = await self._load_transcription_state()
+            # Resolve every URL's transcription status with one lookup
+            url_video_ids = {url: self._extract_video_id(url) for url in urls}
+            transcribed_ids = await self._get_transcribed_video_ids(
+                [video_id for video_id in url_video_ids.values() if video_id]
+            )
             
-            # Filter out already processed URLs
+            # Filter out already processed URLs (and duplicates within this batch)
             new_urls = []
-            for url in urls:
-                video_id = self._extract_video_id(url)
-                if video_id and transcription_state.get(video_id, {}).get('status') != 'completed':
+            queued_ids = set()
+            for url, video_id in url_video_ids.items():
+                if video_id and video_id not in transcribed_ids and video_id not in queued_ids:
+                    queued_ids.add(video_id)
                     new_urls.append(url)
             
             if not new_urls:
                 self.log_step("No new URLs to process - all have been transcribed")
                 return True
             
+            # Load existing video records once instead of once per transcribed video
+            self._video_records = await self._load_video_records()
+            
             # Process each URL
             for i, url in enumerate(new_urls, 1):
                 try:
@@ -141,14 +182,6 @@ class VideoProcessor(BaseProcessor):
         try:
             self.log_step(f"Starting complete pipeline for video {index}")
             
-            # Step 0: Check if already transcribed
-            video_id = self._extract_video_id(url)
-            if video_id:
-                existing = await self._check_existing_transcription(video_id)
-                if existing:
-                    self.log_step(f"Video {video_id} already transcribed, skipping")
-                    return True
-            
             # Step 1: Download video and extract metadata
             video_path, metadata, raw_info = await self._download_video_and_metadata(url, index)
             
@@ -589,71 +622,43 @@ TRANSCRIPT:
     
     def _extract_video_id(self, url: str) -> str:
         """Extract video ID from various platform URLs"""
-        try:
-            # YouTube
-            if 'youtube.com' in url or 'youtu.be' in url:
-                if 'youtu.be/' in url:
-                    return url.split('youtu.be/')[-1].split('?')[0]
-                elif 'v=' in url:
-                    return url.split('v=')[-1].split('&')[0]
-            
-            # Instagram
-            elif 'instagram.com' in url:
-                if '/p/' in url:
-                    return url.split('/p/')[-1].split('/')[0]
-                elif '/reel/' in url:
-                    return url.split('/reel/')[-1].split('/')[0]
-            
-            # TikTok
-            elif 'tiktok.com' in url:
-                if '/video/' in url:
-                    return url.split('/video/')[-1].split('?')[0]
-            
-            # Generic fallback - use last part of URL
-            return url.split('/')[-1].split('?')[0]
-        except Exception:
-            return None
+        return _video_id_from_url(url)
     
     # Database integration methods
-    async def _load_transcription_state(self) -> Dict[str, Any]:
-        """Load transcription state from database"""
+    async def _get_transcribed_video_ids(self, video_ids: List[str]) -> set:
+        """Get the subset of video IDs that are already transcribed"""
         try:
-            videos = await db_manager.get_all_videos()
-            transcription_state = {}
-            for video in videos:
-                video_id = video.get('video_id', '')
-                if video_id:
-                    transcription_state[video_id] = {
-                        'status': 'completed' if video.get('transcription_status') == 'COMPLETED' else 'pending',
-                        'url': video.get('url', ''),
-                        'timestamp': video.get('updated_at', ''),
-                        'transcript': video.get('transcription_text', ''),
-                        'smart_name': video.get('smart_name', '')
-                    }
-            return transcription_state
+            return await db_manager.get_transcribed_video_ids(video_ids)
         except Exception as e:
             self.log_error("Error loading transcription state", e)
-            return {}
+            return set()
     
-    async def _check_existing_transcription(self, video_id: str) -> bool:
-        """Check if video is already transcribed"""
+    async def _load_video_records(self) -> Dict[str, Dict]:
+        """Load existing video records keyed by video ID (or filename when there is none)"""
         try:
-            videos = await db_manager.get_videos_by_video_id(video_id)
-            return len(videos) > 0 and videos[0].get('transcription_status') == 'COMPLETED'
+            videos = await db_manager.get_all_videos()
+            return {video.get('video_id') or video.get('filename', ''): video for video in videos}
         except Exception as e:
-            self.log_error(f"Error checking existing transcription for {video_id}", e)
-            return False
+            self.log_error("Error loading video records", e)
+            return {}
+    
+    def _find_video_record(self, video_id: str) -> Optional[Dict]:
+        """Find an existing video record by video ID, falling back to a filename match"""
+        video_record = self._video_records.get(video_id)
+        if video_record is None:
+            video_record = next(
+                (video for video in self._video_records.values() if video_id in video.get('filename', '')),
+                None
+            )
+        return video_record
     
     async def _update_video_transcription(self, video_id: str, transcript: str, smart_name: str, video_path: str, thumbnail_path: str = None, metadata: dict = None):
         """Update video record with transcription data and metadata"""
         try:
             # Find existing video record
-            videos = await db_manager.get_all_videos()
-            video_record = None
-            for video in videos:
-                if video.get('video_id') == video_id or video_id in video.get('filename', ''):
-                    video_record = video
-                    break
+            if self._video_records is None:
+                self._video_records = await self._load_video_records()
+            video_record = self._find_video_record(video_id)
             
             # Prepare video data with metadata
             video_data = {
@@ -695,6 +700,7 @@ TRANSCRIPT:
                 })
             
             await db_manager.upsert_video(video_data)
+            self._video_records[video_data.get('video_id') or video_id] = {**(video_record or {}), **video_data}
             self.log_step(f"Updated video record with transcription and metadata")
             
             # Update thumbnail if provided
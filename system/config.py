@@ -31,6 +31,9 @@ class Settings(BaseSettings):
     
     # Performance Configuration
     max_concurrent_uploads: int = Field(default=3, description="Maximum concurrent uploads")
+    aiwaverider_max_concurrent_uploads: int = Field(default=8, description="Maximum concurrent AIWaverider uploads, chunked ones included")
+    aiwaverider_max_large_uploads: int = Field(default=2, description="Maximum concurrent chunked AIWaverider uploads, within the overall limit")
+    max_concurrent_thumbnails: int = Field(default=8, description="Maximum thumbnails processed concurrently")
     cache_duration_hours: int = Field(default=1, description="Cache duration in hours")
     chunk_size_mb: int = Field(default=5, description="Chunk size for large file uploads in MB")
     upload_timeout_seconds: int = Field(default=300, description="Upload timeout in seconds")
@@ -87,6 +90,19 @@ class Settings(BaseSettings):
             raise ValueError("Max concurrent uploads must be between 1 and 10")
         return v
     
+    @validator('aiwaverider_max_concurrent_uploads', 'aiwaverider_max_large_uploads')
+    def validate_aiwaverider_concurrency(cls, v):
+        if v < 1 or v > 32:
+            raise ValueError("AIWaverider upload concurrency must be between 1 and 32")
+        return v
+    
+    @validator('aiwaverider_max_large_uploads')
+    def validate_aiwaverider_large_uploads(cls, v, values):
+        max_uploads = values.get('aiwaverider_max_concurrent_uploads')
+        if max_uploads is not None and v > max_uploads:
+            raise ValueError("AIWaverider large uploads cannot exceed aiwaverider_max_concurrent_uploads")
+        return v
+    
     @validator('chunk_size_mb')
     def validate_chunk_size(cls, v):
         if v < 1 or v > 100:
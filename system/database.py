@@ -14,6 +14,16 @@ from contextlib import asynccontextmanager
 from .config import settings
 from .processor_logger import processor_logger as logger
 
+# Applied to every connection: WAL avoids the rollback-journal fsync and NORMAL
+# syncs only at checkpoints, which is still crash-safe in WAL mode
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
 class DatabaseManager:
     """Async SQLite database manager for state management"""
     
@@ -33,11 +43,7 @@ class DatabaseManager:
             
             # Create connection pool
             for _ in range(self.pool_size):
-                conn = await aiosqlite.connect(
-                    self.db_path,
-                    timeout=30.0,  # 30 second timeout
-                    check_same_thread=False
-                )
+                conn = await self._connect()
                 await self._connection_pool.put(conn)
             
             # Create tables
@@ -45,14 +51,28 @@ class DatabaseManager:
             self._initialized = True
             logger.log_step("Database initialized successfully")
     
-    async def _create_tables(self):
-        """Create database tables"""
-        # Create a direct connection for table creation
+    async def ensure_initialized(self):
+        """Initialize the database on first use; a no-op once it is ready"""
+        if not self._initialized:
+            await self.initialize()
+    
+    async def _connect(self) -> aiosqlite.Connection:
+        """Open a new connection with the standard PRAGMAs applied"""
         conn = await aiosqlite.connect(
             self.db_path,
-            timeout=30.0,
+            timeout=30.0,  # 30 second timeout
             check_same_thread=False
         )
+        # Rows come back as sqlite3.Row, so callers can build dicts without re-reading cursor.description
+        conn.row_factory = aiosqlite.Row
+        for pragma in SQLITE_PRAGMAS:
+            await conn.execute(pragma)
+        return conn
+    
+    async def _create_tables(self):
+        """Create database tables"""
+        # Create a direct connection for table creation
+        conn = await self._connect()
         try:
             # Videos table
             await conn.execute("""
@@ -165,40 +185,31 @@ class DatabaseManager:
             await conn.execute("CREATE INDEX IF NOT EXISTS idx_metrics_timestamp ON metrics(timestamp)")
             
             # Add missing columns if they don't exist (migration)
-            try:
-                await conn.execute("ALTER TABLE videos ADD COLUMN aiwaverider_status TEXT DEFAULT 'PENDING'")
-            except Exception:
-                pass  # Column already exists
-            
-            try:
-                await conn.execute("ALTER TABLE thumbnails ADD COLUMN aiwaverider_status TEXT DEFAULT 'PENDING'")
-            except Exception:
-                pass  # Column already exists
-            
-            try:
-                await conn.execute("ALTER TABLE videos ADD COLUMN file_hash TEXT")
-            except Exception:
-                pass  # Column already exists
+            migrations = {
+                'videos': [
+                    "aiwaverider_status TEXT DEFAULT 'PENDING'", "file_hash TEXT",
+                    # Video metadata
+                    "video_id TEXT", "title TEXT", "description TEXT", "username TEXT",
+                    "uploader_id TEXT", "channel_id TEXT", "channel_url TEXT", "platform TEXT",
+                    "duration INTEGER", "width INTEGER", "height INTEGER", "fps REAL",
+                    "format_id TEXT", "view_count INTEGER", "like_count INTEGER", "comment_count INTEGER",
+                    "upload_date TEXT", "thumbnail_url TEXT", "webpage_url TEXT", "extractor TEXT"
+                ],
+                'thumbnails': ["aiwaverider_status TEXT DEFAULT 'PENDING'", "file_hash TEXT"],
+            }
             
-            try:
-                await conn.execute("ALTER TABLE thumbnails ADD COLUMN file_hash TEXT")
-            except Exception:
-                pass  # Column already exists
+            # Read every table's columns in one query instead of probing with failing ALTERs
+            cursor = await conn.execute(
+                "SELECT m.name, p.name FROM sqlite_master m, pragma_table_info(m.name) p "
+                "WHERE m.type = 'table' AND m.name IN ({})".format(", ".join("?" for _ in migrations)),
+                tuple(migrations)
+            )
+            existing_columns = {(table, column) for table, column in await cursor.fetchall()}
             
-            # Add video metadata columns (migration)
-            metadata_columns = [
-                "video_id TEXT", "title TEXT", "description TEXT", "username TEXT",
-                "uploader_id TEXT", "channel_id TEXT", "channel_url TEXT", "platform TEXT",
-                "duration INTEGER", "width INTEGER", "height INTEGER", "fps REAL",
-                "format_id TEXT", "view_count INTEGER", "like_count INTEGER", "comment_count INTEGER",
-                "upload_date TEXT", "thumbnail_url TEXT", "webpage_url TEXT", "extractor TEXT"
-            ]
-            
-            for column in metadata_columns:
-                try:
-                    await conn.execute(f"ALTER TABLE videos ADD COLUMN {column}")
-                except Exception:
-                    pass  # Column already exists
+            for table, columns in migrations.items():
+                for column in columns:
+                    if (table, column.split()[0]) not in existing_columns:
+                        await conn.execute(f"ALTER TABLE {table} ADD COLUMN {column}")
             
             await conn.commit()
         finally:
@@ -219,11 +230,7 @@ class DatabaseManager:
             yield conn
         except asyncio.TimeoutError:
             # If pool is empty, create a new connection
-            conn = await aiosqlite.connect(
-                self.db_path,
-                timeout=30.0,
-                check_same_thread=False
-            )
+            conn = await self._connect()
             try:
                 yield conn
             finally:
@@ -262,6 +269,41 @@ class DatabaseManager:
             result = await cursor.fetchone()
             return result[0] if result else None
     
+    async def upsert_video_upload_states(self, videos: List[Dict[str, Any]]):
+        """Insert or update the Drive upload fields of many videos in one transaction
+        
+        Only upload columns are written on conflict, so transcription data and
+        metadata already stored for a video are kept.
+        """
+        if not videos:
+            return
+        
+        now = datetime.now().isoformat()
+        async with self.get_connection() as conn:
+            await conn.executemany("""
+                INSERT INTO videos (filename, file_path, drive_id, drive_url, upload_status, file_hash, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(filename) DO UPDATE SET
+                    file_path = excluded.file_path,
+                    drive_id = excluded.drive_id,
+                    drive_url = excluded.drive_url,
+                    upload_status = excluded.upload_status,
+                    file_hash = excluded.file_hash,
+                    updated_at = excluded.updated_at
+            """, [
+                (
+                    video.get('filename'),
+                    video.get('file_path'),
+                    video.get('drive_id'),
+                    video.get('drive_url'),
+                    video.get('upload_status', 'PENDING'),
+                    video.get('file_hash'),
+                    now
+                )
+                for video in videos
+            ])
+            await conn.commit()
+    
     async def get_video(self, filename: str) -> Optional[Dict[str, Any]]:
         """Get video record by filename"""
         async with self.get_connection() as conn:
@@ -270,8 +312,7 @@ class DatabaseManager:
             )
             row = await cursor.fetchone()
             if row:
-                columns = [description[0] for description in cursor.description]
-                return dict(zip(columns, row))
+                return dict(row)
             return None
     
     async def get_videos_by_status(self, status: str) -> List[Dict[str, Any]]:
@@ -281,8 +322,7 @@ class DatabaseManager:
                 "SELECT * FROM videos WHERE upload_status = ?", (status,)
             )
             rows = await cursor.fetchall()
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in rows]
+            return [dict(row) for row in rows]
     
     # Thumbnail management methods
     async def upsert_thumbnail(self, thumbnail_data: Dict[str, Any]) -> int:
@@ -314,10 +354,42 @@ class DatabaseManager:
             )
             row = await cursor.fetchone()
             if row:
-                columns = [description[0] for description in cursor.description]
-                return dict(zip(columns, row))
+                return dict(row)
             return None
     
+    async def upsert_thumbnail_upload_states(self, thumbnails: List[Dict[str, Any]]):
+        """Insert or update the Drive upload fields of many thumbnails in one transaction"""
+        if not thumbnails:
+            return
+        
+        now = datetime.now().isoformat()
+        async with self.get_connection() as conn:
+            await conn.executemany("""
+                INSERT INTO thumbnails (filename, file_path, video_filename, drive_id, drive_url, upload_status, file_hash, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(filename) DO UPDATE SET
+                    file_path = excluded.file_path,
+                    video_filename = COALESCE(NULLIF(excluded.video_filename, ''), thumbnails.video_filename),
+                    drive_id = excluded.drive_id,
+                    drive_url = excluded.drive_url,
+                    upload_status = excluded.upload_status,
+                    file_hash = excluded.file_hash,
+                    updated_at = excluded.updated_at
+            """, [
+                (
+                    thumbnail.get('filename'),
+                    thumbnail.get('file_path'),
+                    thumbnail.get('video_filename', ''),
+                    thumbnail.get('drive_id'),
+                    thumbnail.get('drive_url'),
+                    thumbnail.get('upload_status', 'PENDING'),
+                    thumbnail.get('file_hash'),
+                    now
+                )
+                for thumbnail in thumbnails
+            ])
+            await conn.commit()
+    
     # AIWaverider upload management
     async def upsert_aiwaverider_upload(self, upload_data: Dict[str, Any]) -> int:
         """Insert or update AIWaverider upload record"""
@@ -350,8 +422,7 @@ class DatabaseManager:
                 "SELECT * FROM aiwaverider_uploads WHERE upload_status = ?", (status,)
             )
             rows = await cursor.fetchall()
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in rows]
+            return [dict(row) for row in rows]
     
     # Queue management methods
     async def add_task(self, task_type: str, task_data: Dict[str, Any], priority: int = 0) -> int:
@@ -386,8 +457,7 @@ class DatabaseManager:
             
             row = await cursor.fetchone()
             if row:
-                columns = [description[0] for description in cursor.description]
-                task = dict(zip(columns, row))
+                task = dict(row)
                 task['task_data'] = json.loads(task['task_data'])
                 return task
             return None
@@ -415,6 +485,18 @@ class DatabaseManager:
             """, (name, value, unit, json.dumps(tags or {})))
             await conn.commit()
     
+    async def record_metrics(self, metrics: List[tuple]):
+        """Record a batch of (name, value, unit, tags) metrics in one transaction"""
+        if not settings.enable_metrics or not metrics:
+            return
+        
+        async with self.get_connection() as conn:
+            await conn.executemany("""
+                INSERT INTO metrics (metric_name, metric_value, metric_unit, tags)
+                VALUES (?, ?, ?, ?)
+            """, [(name, value, unit, json.dumps(tags or {})) for name, value, unit, tags in metrics])
+            await conn.commit()
+    
     async def get_metrics(self, name: str, hours: int = 24) -> List[Dict[str, Any]]:
         """Get metrics for a specific name within time range"""
         async with self.get_connection() as conn:
@@ -424,8 +506,7 @@ class DatabaseManager:
                 ORDER BY timestamp DESC
             """.format(hours), (name,))
             rows = await cursor.fetchall()
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in rows]
+            return [dict(row) for row in rows]
     
     async def cleanup_old_metrics(self, days: int = None):
         """Clean up old metrics"""
@@ -498,16 +579,14 @@ class DatabaseManager:
                 "SELECT * FROM videos WHERE upload_status = ?", (status,)
             )
             rows = await cursor.fetchall()
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in rows]
+            return [dict(row) for row in rows]
     
     async def get_all_videos(self) -> List[Dict[str, Any]]:
         """Get all videos"""
         async with self.get_connection() as conn:
             cursor = await conn.execute("SELECT * FROM videos")
             rows = await cursor.fetchall()
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in rows]
+            return [dict(row) for row in rows]
     
     async def get_thumbnails_by_status(self, status: str) -> List[Dict[str, Any]]:
         """Get thumbnails by status"""
@@ -516,16 +595,14 @@ class DatabaseManager:
                 "SELECT * FROM thumbnails WHERE upload_status = ?", (status,)
             )
             rows = await cursor.fetchall()
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in rows]
+            return [dict(row) for row in rows]
     
     async def get_all_thumbnails(self) -> List[Dict[str, Any]]:
         """Get all thumbnails"""
         async with self.get_connection() as conn:
             cursor = await conn.execute("SELECT * FROM thumbnails")
             rows = await cursor.fetchall()
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in rows]
+            return [dict(row) for row in rows]
     
     async def get_videos_by_video_id(self, video_id: str) -> List[Dict[str, Any]]:
         """Get videos by video ID"""
@@ -534,8 +611,7 @@ class DatabaseManager:
                 "SELECT * FROM videos WHERE filename LIKE ?", (f"%{video_id}%",)
             )
             rows = await cursor.fetchall()
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in rows]
+            return [dict(row) for row in rows]
     
     async def update_video_status(self, video_id: int, status: str, drive_id: str = None):
         """Update video status"""
@@ -592,8 +668,26 @@ class DatabaseManager:
                 "SELECT * FROM videos WHERE filename LIKE ?", (f"%{video_id}%",)
             )
             rows = await cursor.fetchall()
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in rows]
+            return [dict(row) for row in rows]
+    
+    async def get_transcribed_video_ids(self, video_ids: List[str]) -> set:
+        """Return which of the given video IDs already have a completed transcription
+        
+        A video matches on its video_id column or when the ID appears in its filename.
+        All IDs are resolved from a single query over the status columns only.
+        """
+        async with self.get_connection() as conn:
+            cursor = await conn.execute(
+                "SELECT video_id, filename FROM videos WHERE transcription_status = 'COMPLETED'"
+            )
+            rows = await cursor.fetchall()
+        
+        completed_ids = {row[0] for row in rows if row[0]}
+        completed_filenames = [row[1] or '' for row in rows]
+        return {
+            video_id for video_id in video_ids
+            if video_id in completed_ids or any(video_id in filename for filename in completed_filenames)
+        }
     
     async def update_video_status(self, video_id: int, status: str, drive_id: str = None):
         """Update video status"""
@@ -643,6 +737,42 @@ class DatabaseManager:
             )
             await conn.commit()
     
+    async def bulk_update_video_aiwaverider_status(self, video_ids: List[int], status: str):
+        """Update the AIWaverider upload status of many videos in one transaction"""
+        if not video_ids:
+            return
+        now = datetime.now().isoformat()
+        async with self.get_connection() as conn:
+            await conn.executemany(
+                "UPDATE videos SET aiwaverider_status = ?, updated_at = ? WHERE id = ?",
+                [(status, now, video_id) for video_id in video_ids]
+            )
+            await conn.commit()
+    
+    async def bulk_update_thumbnail_aiwaverider_status(self, thumbnail_ids: List[int], status: str):
+        """Update the AIWaverider upload status of many thumbnails in one transaction"""
+        if not thumbnail_ids:
+            return
+        now = datetime.now().isoformat()
+        async with self.get_connection() as conn:
+            await conn.executemany(
+                "UPDATE thumbnails SET aiwaverider_status = ?, updated_at = ? WHERE id = ?",
+                [(status, now, thumbnail_id) for thumbnail_id in thumbnail_ids]
+            )
+            await conn.commit()
+    
+    async def bulk_update_thumbnail_status(self, thumbnail_ids: List[int], status: str):
+        """Update the status of many thumbnails in one transaction"""
+        if not thumbnail_ids:
+            return
+        now = datetime.now().isoformat()
+        async with self.get_connection() as conn:
+            await conn.executemany(
+                "UPDATE thumbnails SET upload_status = ?, updated_at = ? WHERE id = ?",
+                [(status, now, thumbnail_id) for thumbnail_id in thumbnail_ids]
+            )
+            await conn.commit()
+    
     async def get_videos_by_status(self, status: str) -> List[Dict[str, Any]]:
         """Get videos by status"""
         async with self.get_connection() as conn:
@@ -650,8 +780,7 @@ class DatabaseManager:
                 "SELECT * FROM videos WHERE upload_status = ?", (status,)
             )
             rows = await cursor.fetchall()
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in rows]
+            return [dict(row) for row in rows]
     
     async def get_thumbnails_by_status(self, status: str) -> List[Dict[str, Any]]:
         """Get thumbnails by status"""
@@ -660,24 +789,53 @@ class DatabaseManager:
                 "SELECT * FROM thumbnails WHERE upload_status = ?", (status,)
             )
             rows = await cursor.fetchall()
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in rows]
+            return [dict(row) for row in rows]
     
     async def get_all_videos(self) -> List[Dict[str, Any]]:
         """Get all videos"""
         async with self.get_connection() as conn:
             cursor = await conn.execute("SELECT * FROM videos")
             rows = await cursor.fetchall()
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in rows]
+            return [dict(row) for row in rows]
     
     async def get_all_thumbnails(self) -> List[Dict[str, Any]]:
         """Get all thumbnails"""
         async with self.get_connection() as conn:
             cursor = await conn.execute("SELECT * FROM thumbnails")
             rows = await cursor.fetchall()
-            columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in rows]
+            return [dict(row) for row in rows]
+    
+    async def iter_all_videos(self, batch_size: int = 500):
+        """Yield all videos in id order as lists of up to batch_size rows
+        
+        Pages by id so only one batch is in memory at a time, and the connection
+        goes back to the pool between batches.
+        """
+        last_id = 0
+        while True:
+            async with self.get_connection() as conn:
+                cursor = await conn.execute(
+                    "SELECT * FROM videos WHERE id > ? ORDER BY id LIMIT ?", (last_id, batch_size)
+                )
+                rows = await cursor.fetchall()
+            if not rows:
+                return
+            yield [dict(row) for row in rows]
+            last_id = rows[-1]['id']
+    
+    async def get_export_signature(self) -> List[Any]:
+        """Get row counts and latest update times of videos and thumbnails
+        
+        Any insert or update changes the result, so exporters can compare it with
+        the signature of their last export instead of re-reading every row.
+        """
+        async with self.get_connection() as conn:
+            cursor = await conn.execute(
+                "SELECT (SELECT COUNT(*) FROM videos), (SELECT MAX(updated_at) FROM videos), "
+                "(SELECT COUNT(*) FROM thumbnails), (SELECT MAX(updated_at) FROM thumbnails)"
+            )
+            row = await cursor.fetchone()
+            return list(row)
 
     async def close(self):
         """Close all database connections"""
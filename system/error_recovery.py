@@ -26,6 +26,7 @@ class RetryConfig:
     max_delay: float = 60.0
     exponential_base: float = 2.0
     jitter: bool = True
+    jitter_ratio: float = 0.1  # delay varies by up to this fraction either way
     retryable_exceptions: tuple = (Exception,)
 
 class CircuitBreaker:
@@ -48,51 +49,52 @@ class CircuitBreaker:
         self.total_failures = 0
         self.total_successes = 0
     
-    def call(self, func: Callable, *args, **kwargs):
-        """Execute function with circuit breaker protection"""
+    def before_call(self, name: str):
+        """Fail fast if the circuit is open, otherwise count the request
+        
+        Callers that invoke the protected function themselves pair this with
+        record_success()/record_failure() instead of going through call_async().
+        """
         if self.state == CircuitState.OPEN:
             if time.time() - self.last_failure_time > self.timeout:
                 self.state = CircuitState.HALF_OPEN
-                logger.log_step(f"Circuit breaker transitioning to HALF_OPEN for {func.__name__}")
+                logger.log_step(f"Circuit breaker transitioning to HALF_OPEN for {name}")
             else:
-                raise Exception(f"Circuit breaker is OPEN for {func.__name__}")
+                raise Exception(f"Circuit breaker is OPEN for {name}")
         
         self.total_requests += 1
+    
+    def call(self, func: Callable, *args, **kwargs):
+        """Execute function with circuit breaker protection"""
+        self.before_call(func.__name__)
         
         try:
             result = func(*args, **kwargs)
-            self._on_success()
+            self.record_success()
             return result
         except self.expected_exception as e:
-            self._on_failure()
+            self.record_failure()
             raise e
     
     async def call_async(self, func: Callable, *args, **kwargs):
         """Execute async function with circuit breaker protection"""
-        if self.state == CircuitState.OPEN:
-            if time.time() - self.last_failure_time > self.timeout:
-                self.state = CircuitState.HALF_OPEN
-                logger.log_step(f"Circuit breaker transitioning to HALF_OPEN for {func.__name__}")
-            else:
-                raise Exception(f"Circuit breaker is OPEN for {func.__name__}")
-        
-        self.total_requests += 1
+        self.before_call(func.__name__)
         
         try:
             result = await func(*args, **kwargs)
-            self._on_success()
+            self.record_success()
             return result
         except self.expected_exception as e:
-            self._on_failure()
+            self.record_failure()
             raise e
     
-    def _on_success(self):
+    def record_success(self):
         """Handle successful call"""
         self.failure_count = 0
         self.state = CircuitState.CLOSED
         self.total_successes += 1
     
-    def _on_failure(self):
+    def record_failure(self):
         """Handle failed call"""
         self.failure_count += 1
         self.last_failure_time = time.time()
@@ -127,8 +129,12 @@ class RetryManager:
             self.circuit_breakers[service_name] = CircuitBreaker()
         return self.circuit_breakers[service_name]
     
-    def calculate_delay(self, attempt: int) -> float:
-        """Calculate delay for retry attempt"""
+    def calculate_delay(self, attempt: int, exception: Exception = None) -> float:
+        """Calculate delay for retry attempt, honouring a server's Retry-After"""
+        retry_after = self._retry_after(exception)
+        if retry_after is not None:
+            return min(retry_after, self.config.max_delay)
+        
         delay = min(
             self.config.base_delay * (self.config.exponential_base ** attempt),
             self.config.max_delay
@@ -136,14 +142,37 @@ class RetryManager:
         
         if self.config.jitter:
             # Add jitter to prevent thundering herd
-            jitter = random.uniform(0, delay * 0.1)
-            delay += jitter
+            delay *= random.uniform(1 - self.config.jitter_ratio, 1 + self.config.jitter_ratio)
         
         return delay
     
+    @staticmethod
+    def _http_response(exception: Exception) -> Optional[Any]:
+        """Get the HTTP response of a client error such as googleapiclient's HttpError"""
+        response = getattr(exception, 'resp', None)
+        return response if hasattr(response, 'status') else None
+    
+    def _retry_after(self, exception: Exception) -> Optional[float]:
+        """Seconds the server asked us to wait before retrying, if it said"""
+        response = self._http_response(exception)
+        if response is None:
+            return None
+        try:
+            return max(float(response.get('retry-after')), 0.0)
+        except (TypeError, ValueError):
+            return None
+    
     def is_retryable(self, exception: Exception) -> bool:
         """Check if exception is retryable"""
-        return isinstance(exception, self.config.retryable_exceptions)
+        if not isinstance(exception, self.config.retryable_exceptions):
+            return False
+        
+        # Client errors won't succeed on retry, except timeouts and rate limiting
+        response = self._http_response(exception)
+        if response is not None:
+            status = int(response.status)
+            return not (400 <= status < 500) or status in (408, 429)
+        return True
     
     async def retry_async(self, 
                          func: Callable, 
@@ -169,7 +198,7 @@ class RetryManager:
                     logger.log_error(f"Function {func.__name__} failed after {self.config.max_retries} retries: {str(e)}")
                     raise e
                 
-                delay = self.calculate_delay(attempt)
+                delay = self.calculate_delay(attempt, e)
                 logger.log_step(f"Retrying {func.__name__} in {delay:.2f}s (attempt {attempt + 1}/{self.config.max_retries})")
                 await asyncio.sleep(delay)
     
@@ -197,7 +226,7 @@ class RetryManager:
                     logger.log_error(f"Function {func.__name__} failed after {self.config.max_retries} retries: {str(e)}")
                     raise e
                 
-                delay = self.calculate_delay(attempt)
+                delay = self.calculate_delay(attempt, e)
                 logger.log_step(f"Retrying {func.__name__} in {delay:.2f}s (attempt {attempt + 1}/{self.config.max_retries})")
                 time.sleep(delay)
 
@@ -224,9 +253,10 @@ def retry_sync(config: RetryConfig = None, service_name: str = "default"):
 
 # Specific retry configurations for different services
 GOOGLE_API_RETRY_CONFIG = RetryConfig(
-    max_retries=3,
+    max_retries=5,
     base_delay=1.0,
     max_delay=30.0,
+    jitter_ratio=0.5,  # spread out retries of requests that hit the quota together
     retryable_exceptions=(Exception,)
 )
 
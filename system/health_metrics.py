@@ -223,6 +223,12 @@ class MetricsCollector:
         self.metrics: List[Metric] = []
         self.processing_metrics: Optional[ProcessingMetrics] = None
         self.health_checker = HealthChecker()
+        
+        # Metrics waiting to be written; bursts are coalesced into one database write
+        self.flush_delay = 0.5
+        self._pending_metrics: List[Metric] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
     
     def record_metric(self, 
                      name: str, 
@@ -244,19 +250,50 @@ class MetricsCollector:
         self.metrics.append(metric)
         
         # Also store in database
-        asyncio.create_task(self._store_metric_async(metric))
+        self._pending_metrics.append(metric)
+        self._schedule_flush()
     
-    async def _store_metric_async(self, metric: Metric):
-        """Store metric in database asynchronously"""
+    def _schedule_flush(self):
+        """Start the background flush unless one is already waiting
+        
+        Metrics may be recorded from worker threads, so the flush task is
+        always created on the collector's event loop.
+        """
         try:
-            await db_manager.record_metric(
-                name=metric.name,
-                value=metric.value,
-                unit=metric.unit,
-                tags=metric.tags
-            )
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        
+        if running_loop is None or running_loop is not self._loop:
+            if self._loop is not None and self._loop.is_running():
+                self._loop.call_soon_threadsafe(self._schedule_flush)
+            elif running_loop is not None:
+                self._loop = running_loop
+                self._schedule_flush()
+            # Without a loop the metrics stay pending until flush_metrics() is awaited
+            return
+        
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = self._loop.create_task(self._flush_after_delay())
+    
+    async def _flush_after_delay(self):
+        """Wait for the current burst of metrics to settle, then store it"""
+        await asyncio.sleep(self.flush_delay)
+        await self.flush_metrics()
+    
+    async def flush_metrics(self):
+        """Store all pending metrics in the database in one batch"""
+        if not self._pending_metrics:
+            return
+        
+        batch, self._pending_metrics = self._pending_metrics, []
+        try:
+            await db_manager.record_metrics([
+                (metric.name, metric.value, metric.unit, metric.tags)
+                for metric in batch
+            ])
         except Exception as e:
-            logger.log_error(f"Failed to store metric {metric.name}: {str(e)}")
+            logger.log_error(f"Failed to store {len(batch)} metrics: {str(e)}")
     
     def start_processing_metrics(self) -> ProcessingMetrics:
         """Start tracking processing metrics"""
@@ -264,6 +301,10 @@ class MetricsCollector:
             start_time=time.time(),
             end_time=0.0
         )
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
         return self.processing_metrics
     
     def finish_processing_metrics(self):
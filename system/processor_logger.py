@@ -3,12 +3,14 @@ Logging system for social media processor
 """
 import os
 import json
+import atexit
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
 
 class ProcessorLogger:
-    def __init__(self, log_dir="logs"):
+    def __init__(self, log_dir="logs", save_interval=5.0):
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
         
@@ -26,6 +28,20 @@ class ProcessorLogger:
             'errors': [],
             'uploads': []
         }
+        
+        # Session entries are appended by a background saver instead of on every log call
+        self.save_interval = save_interval
+        self._pending_entries = [{
+            'section': 'session',
+            'start_time': self.session_data['start_time'],
+            'session_id': self.session_id
+        }]
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._saver = threading.Thread(target=self._periodic_saver, name='session-saver', daemon=True)
+        self._saver.start()
+        atexit.register(self.close)
     
     def setup_logging(self):
         # Main logger
@@ -61,12 +77,11 @@ class ProcessorLogger:
             msg += f" - {json.dumps(details)}"
         self.logger.info(msg)
         
-        self.session_data['steps'].append({
+        self._record('steps', {
             'timestamp': datetime.now().isoformat(),
             'step': step_name,
             'details': details or {}
         })
-        self._save_session()
     
     def log_error(self, error_msg, error_type=None, details=None):
         """Log an error with context"""
@@ -75,13 +90,12 @@ class ProcessorLogger:
             msg = f"{error_type}: {msg}"
         self.logger.error(msg)
         
-        self.session_data['errors'].append({
+        self._record('errors', {
             'timestamp': datetime.now().isoformat(),
             'error': error_msg,
             'type': error_type,
             'details': details or {}
         })
-        self._save_session()
     
     def log_upload(self, file_type, file_name, drive_id=None, status=None):
         """Log a file upload"""
@@ -92,20 +106,54 @@ class ProcessorLogger:
             msg += f" - {status}"
         self.logger.info(msg)
         
-        self.session_data['uploads'].append({
+        self._record('uploads', {
             'timestamp': datetime.now().isoformat(),
             'file_type': file_type,
             'file_name': file_name,
             'drive_id': drive_id,
             'status': status
         })
-        self._save_session()
     
-    def _save_session(self):
-        """Save session data to JSON file"""
-        session_file = self.log_dir / f'session_{self.session_id}.json'
-        with open(session_file, 'w') as f:
-            json.dump(self.session_data, f, indent=2)
+    def _record(self, section, entry):
+        """Add an entry to the session data and queue it for the next save"""
+        with self._lock:
+            self.session_data[section].append(entry)
+            self._pending_entries.append({'section': section, **entry})
+    
+    def _periodic_saver(self):
+        """Save the session every save_interval seconds while there are changes"""
+        while not self._stop_event.wait(self.save_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                # Keep the saver alive; the entries stay queued for the next attempt
+                self.logger.error(f"Error saving session log: {e}")
+    
+    def flush(self):
+        """Append session entries recorded since the last save"""
+        with self._save_lock:
+            with self._lock:
+                if not self._pending_entries:
+                    return
+                entries, self._pending_entries = self._pending_entries, []
+            try:
+                self._save_session(''.join(json.dumps(entry, default=str) + '\n' for entry in entries))
+            except Exception:
+                # Put the entries back ahead of anything recorded meanwhile
+                with self._lock:
+                    self._pending_entries[:0] = entries
+                raise
+    
+    def close(self):
+        """Stop the background saver and write any pending session data"""
+        self._stop_event.set()
+        self.flush()
+    
+    def _save_session(self, payload):
+        """Append session entries to the NDJSON session log (one JSON object per line)"""
+        session_file = self.log_dir / f'session_{self.session_id}.ndjson'
+        with open(session_file, 'a') as f:
+            f.write(payload)
 
 # Global logger instance
 processor_logger = ProcessorLogger()
\ No newline at end of file
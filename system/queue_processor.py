@@ -59,6 +59,11 @@ class Worker:
         self.current_task: Optional[Task] = None
         self.processed_count = 0
         self.error_count = 0
+        
+        # Idle workers sleep until a task is queued or they are stopped; the
+        # poll interval only catches tasks added outside this process
+        self.poll_interval = 30.0
+        self._wake_event = asyncio.Event()
     
     async def start(self):
         """Start the worker"""
@@ -71,16 +76,29 @@ class Worker:
                 if task:
                     await self._process_task(task)
                 else:
-                    # No tasks available, wait a bit
-                    await asyncio.sleep(1)
+                    # No tasks available, wait until woken
+                    await self._wait_for_work(self.poll_interval)
             except Exception as e:
                 logger.log_error(f"Worker {self.worker_id} error: {str(e)}")
                 self.error_count += 1
-                await asyncio.sleep(5)  # Wait before retrying
+                await self._wait_for_work(5)  # Wait before retrying
+    
+    def notify(self):
+        """Wake the worker because new work is available"""
+        self._wake_event.set()
+    
+    async def _wait_for_work(self, timeout: float):
+        """Sleep until notified, stopped, or the timeout expires"""
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._wake_event.clear()
     
     async def stop(self):
         """Stop the worker"""
         self.is_running = False
+        self._wake_event.set()
         logger.log_step(f"Worker {self.worker_id} stopped")
     
     async def _get_next_task(self) -> Optional[Task]:
@@ -300,6 +318,10 @@ class QueueProcessor:
         """Add a task to the queue"""
         task_id = await db_manager.add_task(task_type.value, data, priority)
         logger.log_step(f"Added task {task_id}: {task_type.value}")
+        
+        # Wake idle workers instead of waiting for their next poll
+        for worker in self.workers:
+            worker.notify()
         return task_id
     
     async def add_video_processing_pipeline(self, video_url: str, priority: int = 0) -> List[int]: